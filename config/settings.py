@@ -4,12 +4,64 @@ Configuration settings for n8n AI Knowledge System using Pydantic.
 
 import logging
 import os
+import re
 from enum import Enum
+from functools import cached_property, lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, get_origin
+
+from dotenv import dotenv_values
+from pydantic import AliasChoices, Field, PrivateAttr, SecretStr, field_validator
+from pydantic.fields import FieldInfo
+from pydantic_settings import (
+    BaseSettings,
+    EnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+# Project paths, resolved once at import
+_BASE_DIR = Path(__file__).resolve().parent.parent
+_DATA_DIR = _BASE_DIR / "data"
+_LOGS_DIR = _DATA_DIR / "logs"
+_BACKUPS_DIR = _BASE_DIR / "backups"
+
+# Splits comma-separated env values and strips the surrounding whitespace in one pass
+_CSV_RE = re.compile(r"\s*,\s*")
+
+# Numeric logging levels by name, used instead of looking names up on ``logging``
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Boolean spellings accepted in env values, resolved before pydantic sees them
+_BOOL_VALUES = {
+    "true": True, "1": True, "yes": True, "on": True, "t": True, "y": True,
+    "false": False, "0": False, "no": False, "off": False, "f": False, "n": False,
+}
+
+# Lowercased copy of os.environ shared by every section while a Settings
+# instance is being built; None outside of a build
+_env_snapshot: Optional[Dict[str, str]] = None
+
+# Model configuration shared by every settings class; settings are read-only once loaded
+_SETTINGS_CONFIG = SettingsConfigDict(
+    case_sensitive=False,
+    use_enum_values=True,
+    extra="ignore",
+    frozen=True,
+    # Build validators on first instantiation rather than at import
+    defer_build=True,
+)
+
+# Directories already created by this process, shared by all Settings instances
+_ENSURED: Set[str] = set()
 
 
 class Environment(str, Enum):
@@ -27,6 +79,11 @@ class LogLevel(str, Enum):
     WARNING = "WARNING"
     ERROR = "ERROR"
     CRITICAL = "CRITICAL"
+    
+    @property
+    def int_value(self) -> int:
+        """Numeric level for Python logging."""
+        return _LOG_LEVELS[self.value]
 
 
 class UpdateFrequency(str, Enum):
@@ -37,26 +94,128 @@ class UpdateFrequency(str, Enum):
     MONTHLY = "monthly"
 
 
+@lru_cache(maxsize=1)
+def _dotenv_values() -> Dict[str, Optional[str]]:
+    """Parse ``.env`` once per process, keyed by lowercased variable name."""
+    if not os.path.isfile(".env"):
+        return {}
+    return {
+        key.lower(): value
+        for key, value in dotenv_values(".env", encoding="utf-8").items()
+    }
+
+
+def _snapshot_environ() -> Dict[str, str]:
+    """Take a lowercased copy of ``os.environ`` for case-insensitive lookups."""
+    return {key.lower(): value for key, value in os.environ.items()}
+
+
+def _is_section(annotation: Any) -> bool:
+    """Whether a field holds a whole configuration section."""
+    return isinstance(annotation, type) and issubclass(annotation, BaseConfig)
+
+
+@lru_cache(maxsize=128)
+def _split_csv(raw: str) -> Tuple[str, ...]:
+    """Split a comma-separated env value, memoised per raw string."""
+    return tuple(_CSV_RE.split(raw.strip()))
+
+
+class _CSVEnvSettingsSource(EnvSettingsSource):
+    """Environment variable source with table-driven booleans and comma-separated lists."""
+    
+    def _load_env_vars(self) -> Dict[str, Optional[str]]:
+        if _env_snapshot is not None:
+            return _env_snapshot
+        return _snapshot_environ()
+    
+    def get_field_value(self, field: FieldInfo, field_name: str) -> Tuple[Any, str, bool]:
+        # Sections read their own variables; DB=..., LOG=... etc. are not sections
+        if _is_section(field.annotation):
+            return None, field_name, False
+        return super().get_field_value(field, field_name)
+    
+    def prepare_field_value(self, field_name: str, field: FieldInfo, value: Any, value_is_complex: bool) -> Any:
+        if field.annotation is bool and isinstance(value, str):
+            return _BOOL_VALUES.get(value.strip().lower(), value)
+        if (
+            isinstance(value, str)
+            and get_origin(field.annotation) is list
+            and not value.lstrip().startswith("[")
+        ):
+            return list(_split_csv(value))
+        return super().prepare_field_value(field_name, field, value, value_is_complex)
+
+
+class _DotEnvCacheSettingsSource(_CSVEnvSettingsSource):
+    """``.env`` source backed by the values parsed once per process."""
+    
+    def _load_env_vars(self) -> Dict[str, Optional[str]]:
+        return _dotenv_values()
+
+
 class BaseConfig(BaseSettings):
     """Base configuration with common settings."""
     
-    model_config = {
-        "env_file": ".env",
-        "env_file_encoding": "utf-8",
-        "case_sensitive": False,
-        "use_enum_values": True,
-        "extra": "ignore"
+    model_config = _SETTINGS_CONFIG
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        return (
+            init_settings,
+            _CSVEnvSettingsSource(settings_cls),
+            _DotEnvCacheSettingsSource(settings_cls),
+            file_secret_settings,
+        )
+
+    @classmethod
+    def fast_init(cls) -> "BaseConfig":
+        """Build the section, skipping validation when nothing overrides its defaults."""
+        env_vars = _env_snapshot if _env_snapshot is not None else _snapshot_environ()
+        dotenv = _dotenv_values()
+        if any(name in env_vars or name in dotenv for name in _env_names(cls)):
+            return cls()
+        return cls.model_construct(_fields_set=set(), **_enum_defaults(cls))
+
+
+@lru_cache(maxsize=None)
+def _enum_defaults(config_cls: Type[BaseConfig]) -> Dict[str, Any]:
+    """Enum field defaults as plain values, as ``use_enum_values`` stores them after validation."""
+    return {
+        name: field.default.value
+        for name, field in config_cls.model_fields.items()
+        if isinstance(field.default, Enum)
     }
 
 
+@lru_cache(maxsize=None)
+def _env_names(config_cls: Type[BaseConfig]) -> frozenset:
+    """Lowercased env names (field names and alias choices) read by a section."""
+    names = set()
+    for name, field in config_cls.model_fields.items():
+        alias = field.validation_alias
+        if isinstance(alias, AliasChoices):
+            names.update(str(choice).lower() for choice in alias.choices)
+        else:
+            names.add((alias if isinstance(alias, str) else name).lower())
+    return frozenset(names)
+
+
 class PathConfig(BaseConfig):
     """Path-related configuration."""
     
     # Base paths
-    base_dir: Path = Field(default_factory=lambda: Path(__file__).parent.parent)
-    data_dir: Path = Field(default=None)
-    logs_dir: Path = Field(default=None)
-    backups_dir: Path = Field(default=None)
+    base_dir: Path = Field(default_factory=lambda: _BASE_DIR)
+    data_dir: Path = Field(default_factory=lambda: _DATA_DIR)
+    logs_dir: Path = Field(default_factory=lambda: _LOGS_DIR)
+    backups_dir: Path = Field(default_factory=lambda: _BACKUPS_DIR)
     
     # Data storage paths
     data_directory: str = Field(default="/Users/user/Projects/n8n-projects/n8n-web-scrapper/data", env="DATA_DIRECTORY")
@@ -67,18 +226,6 @@ class PathConfig(BaseConfig):
     logs_directory: str = Field(default="/Users/user/Projects/n8n-projects/n8n-web-scrapper/data/logs", env="LOGS_DIRECTORY")
     exports_directory: str = Field(default="/Users/user/Projects/n8n-projects/n8n-web-scrapper/data/exports", env="EXPORTS_DIRECTORY")
     config_directory: str = Field(default="/Users/user/Projects/n8n-projects/n8n-web-scrapper/config", env="CONFIG_DIRECTORY")
-    
-    @validator("data_dir", pre=True, always=True)
-    def set_data_dir(cls, v: Optional[Path], values: Dict[str, Any]) -> Path:
-        return v or values["base_dir"] / "data"
-    
-    @validator("logs_dir", pre=True, always=True)
-    def set_logs_dir(cls, v: Optional[Path], values: Dict[str, Any]) -> Path:
-        return v or values["base_dir"] / "data" / "logs"
-    
-    @validator("backups_dir", pre=True, always=True)
-    def set_backups_dir(cls, v: Optional[Path], values: Dict[str, Any]) -> Path:
-        return v or values["base_dir"] / "backups"
 
 
 class APIConfig(BaseConfig):
@@ -90,7 +237,7 @@ class APIConfig(BaseConfig):
     api_reload: bool = Field(default=True, env="API_RELOAD")
     api_debug: bool = Field(default=False, env="API_DEBUG")
     api_workers: int = Field(default=1, env="API_WORKERS")
-    api_key: Optional[str] = Field(default=None, env="API_KEY")
+    api_key: Optional[SecretStr] = Field(default=None, env="API_KEY")
     
     # API Security
     api_secret_key: str = Field(default="your_secret_key_here_change_this_in_production", env="API_SECRET_KEY")
@@ -101,37 +248,19 @@ class APIConfig(BaseConfig):
     rate_limit_burst: int = Field(default=10, env="RATE_LIMIT_BURST")
     
     # CORS Settings
-    cors_allow_origins: List[str] = Field(default=["http://localhost:3000", "http://localhost:8501"], env="CORS_ALLOW_ORIGINS")
+    # CORS_ORIGINS is the legacy name, honoured when CORS_ALLOW_ORIGINS is unset
+    cors_allow_origins: List[str] = Field(
+        default=["http://localhost:3000", "http://localhost:8501"],
+        validation_alias=AliasChoices("cors_allow_origins", "cors_origins"),
+    )
     cors_allow_credentials: bool = Field(default=True, env="CORS_ALLOW_CREDENTIALS")
     cors_allow_methods: List[str] = Field(default=["GET", "POST", "PUT", "DELETE"], env="CORS_ALLOW_METHODS")
     cors_allow_headers: List[str] = Field(default=["*"], env="CORS_ALLOW_HEADERS")
     
-    # Legacy CORS setting for backward compatibility
-    cors_origins: List[str] = Field(default=["*"], env="CORS_ORIGINS")
-    
-    @validator("cors_origins", pre=True)
-    def parse_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
-        return v
-    
-    @validator("cors_allow_origins", pre=True)
-    def parse_cors_allow_origins(cls, v: Union[str, List[str]]) -> List[str]:
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
-        return v
-    
-    @validator("cors_allow_methods", pre=True)
-    def parse_cors_allow_methods(cls, v: Union[str, List[str]]) -> List[str]:
-        if isinstance(v, str):
-            return [method.strip() for method in v.split(",")]
-        return v
-    
-    @validator("cors_allow_headers", pre=True)
-    def parse_cors_allow_headers(cls, v: Union[str, List[str]]) -> List[str]:
-        if isinstance(v, str):
-            return [header.strip() for header in v.split(",")]
-        return v
+    @property
+    def cors_origins(self) -> List[str]:
+        """Legacy alias of ``cors_allow_origins``."""
+        return self.cors_allow_origins
 
 
 # class StreamlitConfig(BaseConfig):
@@ -145,13 +274,13 @@ class AIConfig(BaseConfig):
     """AI and LLM configuration."""
     
     # OpenAI Configuration
-    openai_api_key: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
+    openai_api_key: Optional[SecretStr] = Field(default=None, env="OPENAI_API_KEY")
     openai_model: str = Field(default="gpt-4", env="OPENAI_MODEL")
     openai_max_tokens: int = Field(default=2000, env="OPENAI_MAX_TOKENS")
     openai_temperature: float = Field(default=0.1, env="OPENAI_TEMPERATURE")
     
     # Anthropic Configuration
-    anthropic_api_key: Optional[str] = Field(default=None, env="ANTHROPIC_API_KEY")
+    anthropic_api_key: Optional[SecretStr] = Field(default=None, env="ANTHROPIC_API_KEY")
     anthropic_model: str = Field(default="claude-3-sonnet-20240229", env="ANTHROPIC_MODEL")
     anthropic_max_tokens: int = Field(default=2000, env="ANTHROPIC_MAX_TOKENS")
     anthropic_temperature: float = Field(default=0.1, env="ANTHROPIC_TEMPERATURE")
@@ -169,7 +298,8 @@ class AIConfig(BaseConfig):
     conversation_memory_limit: int = Field(default=10, env="CONVERSATION_MEMORY_LIMIT")
     conversation_timeout_minutes: int = Field(default=30, env="CONVERSATION_TIMEOUT_MINUTES")
     
-    @validator("default_ai_provider")
+    @field_validator("default_ai_provider")
+    @classmethod
     def validate_ai_provider(cls, v: str) -> str:
         allowed_providers = ["openai", "anthropic"]
         if v not in allowed_providers:
@@ -217,11 +347,11 @@ class DatabaseConfig(BaseConfig):
     chroma_distance_function: str = Field(default="cosine", env="CHROMA_DISTANCE_FUNCTION")
     
     # Vector Database
-    vector_db_path: Optional[Path] = Field(default=None, env="VECTOR_DB_PATH")
+    vector_db_path: Optional[str] = Field(default=None, env="VECTOR_DB_PATH")
     vector_db_collection: str = Field(default="n8n_docs", env="VECTOR_DB_COLLECTION")
     
     # Knowledge Database
-    knowledge_db_path: Optional[Path] = Field(default=None, env="KNOWLEDGE_DB_PATH")
+    knowledge_db_path: Optional[str] = Field(default=None, env="KNOWLEDGE_DB_PATH")
     
     # SQLite Configuration (for workflows)
     sqlite_db_path: str = Field(default="/Users/user/Projects/n8n-projects/n8n-web-scrapper/data/databases/sqlite/workflows.db", env="SQLITE_DB_PATH")
@@ -234,7 +364,7 @@ class DatabaseConfig(BaseConfig):
     redis_host: str = Field(default="localhost", env="REDIS_HOST")
     redis_port: int = Field(default=6379, env="REDIS_PORT")
     redis_db: int = Field(default=0, env="REDIS_DB")
-    redis_password: Optional[str] = Field(default=None, env="REDIS_PASSWORD")
+    redis_password: Optional[SecretStr] = Field(default=None, env="REDIS_PASSWORD")
 
 
 class ScrapingConfig(BaseConfig):
@@ -284,9 +414,6 @@ class UpdateConfig(BaseConfig):
     
     # Notifications
     notifications_enabled: bool = Field(default=True, env="NOTIFICATIONS_ENABLED")
-    webhook_url: Optional[str] = Field(default=None, env="WEBHOOK_URL")
-    slack_webhook_url: Optional[str] = Field(default=None, env="SLACK_WEBHOOK_URL")
-    discord_webhook_url: Optional[str] = Field(default=None, env="DISCORD_WEBHOOK_URL")
 
 
 class LoggingConfig(BaseConfig):
@@ -297,7 +424,7 @@ class LoggingConfig(BaseConfig):
         default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         env="LOG_FORMAT"
     )
-    log_file: Optional[Path] = Field(default=None, env="LOG_FILE")
+    log_file: Optional[str] = Field(default=None, env="LOG_FILE")
     log_max_size: int = Field(default=10485760, env="LOG_MAX_SIZE")  # 10MB
     log_backup_count: int = Field(default=5, env="LOG_BACKUP_COUNT")
     enable_json_logging: bool = Field(default=False, env="ENABLE_JSON_LOGGING")
@@ -327,45 +454,52 @@ class PerformanceConfig(BaseConfig):
 class SecurityConfig(BaseConfig):
     """Security configuration."""
     
-    secret_key: str = Field(default="your-secret-key-change-in-production", env="SECRET_KEY")
+    secret_key: SecretStr = Field(default=SecretStr("your-secret-key-change-in-production"), env="SECRET_KEY")
     jwt_algorithm: str = Field(default="HS256", env="JWT_ALGORITHM")
     jwt_expiration_hours: int = Field(default=24, env="JWT_EXPIRATION_HOURS")
     enable_rate_limiting: bool = Field(default=True, env="ENABLE_RATE_LIMITING")
     rate_limit_requests: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
     rate_limit_window: int = Field(default=3600, env="RATE_LIMIT_WINDOW")  # 1 hour
-    
-    # Authentication
-    auth_enabled: bool = Field(default=False, env="AUTH_ENABLED")
-    auth_secret_key: str = Field(default="your_auth_secret_key_here", env="AUTH_SECRET_KEY")
-    auth_algorithm: str = Field(default="HS256", env="AUTH_ALGORITHM")
 
 
-class MonitoringConfig(BaseConfig):
-    """Monitoring and observability configuration."""
+class DeferredConfig(BaseConfig):
+    """Rarely read settings, loaded on first access through ``Settings.deferred``."""
     
+    # Monitoring and observability
     enable_metrics: bool = Field(default=True, env="ENABLE_METRICS")
     metrics_port: int = Field(default=9090, env="METRICS_PORT")
     enable_health_checks: bool = Field(default=True, env="ENABLE_HEALTH_CHECKS")
     health_check_interval: int = Field(default=30, env="HEALTH_CHECK_INTERVAL")
     enable_tracing: bool = Field(default=False, env="ENABLE_TRACING")
     jaeger_endpoint: Optional[str] = Field(default=None, env="JAEGER_ENDPOINT")
+    
+    # Authentication
+    auth_enabled: bool = Field(default=False, env="AUTH_ENABLED")
+    auth_secret_key: str = Field(default="your_auth_secret_key_here", env="AUTH_SECRET_KEY")
+    auth_algorithm: str = Field(default="HS256", env="AUTH_ALGORITHM")
+    
+    # Notifications
+    webhook_url: Optional[str] = Field(default=None, env="WEBHOOK_URL")
+    slack_webhook_url: Optional[str] = Field(default=None, env="SLACK_WEBHOOK_URL")
+    discord_webhook_url: Optional[str] = Field(default=None, env="DISCORD_WEBHOOK_URL")
 
 
-class Settings(
-    PathConfig,
-    APIConfig,
-    # StreamlitConfig,  # Removed - replaced by Next.js frontend
-    N8nConfig,
-    AIConfig,
-    DatabaseConfig,
-    ScrapingConfig,
-    UpdateConfig,
-    LoggingConfig,
-    PerformanceConfig,
-    SecurityConfig,
-    MonitoringConfig,
-):
-    """Main application settings combining all configuration sections."""
+class Settings(BaseConfig):
+    """Main application settings composed of the configuration sections."""
+    
+    # Configuration sections
+    paths: PathConfig = Field(default_factory=PathConfig.fast_init)
+    api: APIConfig = Field(default_factory=APIConfig.fast_init)
+    # streamlit: StreamlitConfig  # Removed - replaced by Next.js frontend
+    n8n: N8nConfig = Field(default_factory=N8nConfig.fast_init)
+    ai: AIConfig = Field(default_factory=AIConfig.fast_init)
+    db: DatabaseConfig = Field(default_factory=DatabaseConfig.fast_init)
+    scraping: ScrapingConfig = Field(default_factory=ScrapingConfig.fast_init)
+    updates: UpdateConfig = Field(default_factory=UpdateConfig.fast_init)
+    log: LoggingConfig = Field(default_factory=LoggingConfig.fast_init)
+    performance: PerformanceConfig = Field(default_factory=PerformanceConfig.fast_init)
+    security: SecurityConfig = Field(default_factory=SecurityConfig.fast_init)
+    # Monitoring, auth and notification settings live in ``deferred``
     
     # Application metadata
     app_name: str = Field(default="n8n AI Knowledge System", env="APP_NAME")
@@ -373,89 +507,220 @@ class Settings(
     environment: Environment = Field(default=Environment.DEVELOPMENT, env="ENVIRONMENT")
     debug: bool = Field(default=False, env="DEBUG")
     
+    # Environment checks, computed once at construction
+    _is_development: bool = PrivateAttr(default=False)
+    _is_production: bool = PrivateAttr(default=False)
+    _is_testing: bool = PrivateAttr(default=False)
+    _log_level_int: int = PrivateAttr(default=logging.INFO)
+    
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._ensure_directories()
+        # Scan os.environ once for all sections instead of once per section
+        global _env_snapshot
+        _env_snapshot = _snapshot_environ()
+        try:
+            super().__init__(**self._route_flat_kwargs(kwargs))
+        finally:
+            _env_snapshot = None
         self._setup_derived_paths()
+        self._is_development = self.environment == Environment.DEVELOPMENT
+        self._is_production = self.environment == Environment.PRODUCTION
+        self._is_testing = self.environment == Environment.TESTING
+        self._log_level_int = LogLevel(self.log.log_level).int_value
+        self._ensure_directories()
+    
+    @classmethod
+    def _route_flat_kwargs(cls, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Move flat keyword arguments such as ``api_port=8080`` into their sections."""
+        sections: Dict[str, Dict[str, Any]] = {}
+        for name, value in kwargs.items():
+            section = None if name in cls.model_fields else _SECTION_FIELDS.get(name)
+            if section is None:
+                continue
+            if section == "deferred":
+                raise TypeError(f"{name!r} is read from the environment on first access and cannot be passed")
+            if section in kwargs:
+                raise TypeError(f"{name!r} cannot be passed together with the {section!r} section")
+            sections.setdefault(section, {})[name] = value
+        if not sections:
+            return kwargs
+        
+        routed = {
+            name: value for name, value in kwargs.items()
+            if name in cls.model_fields or name not in _SECTION_FIELDS
+        }
+        for section, values in sections.items():
+            routed[section] = cls.model_fields[section].annotation(**values)
+        return routed
     
     def _ensure_directories(self) -> None:
-        """Ensure all required directories exist."""
+        """Ensure all required directories exist, once per process."""
+        # Tests work in temporary directories and never need the real ones
+        if self._is_testing:
+            return
+        
+        data_dir = str(self.paths.data_dir)
         directories = [
-            self.data_dir,
-            self.logs_dir,
-            self.backups_dir,
-            self.data_dir / "scraped_docs",
-            self.data_dir / "exports",
-            self.data_dir / "analysis",
+            data_dir,
+            str(self.paths.logs_dir),
+            str(self.paths.backups_dir),
+            os.path.join(data_dir, "scraped_docs"),
+            os.path.join(data_dir, "exports"),
+            os.path.join(data_dir, "analysis"),
         ]
         
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+        # Parents sort before children, so each directory needs a single mkdir
+        for directory in sorted(directories, key=lambda path: path.count(os.sep)):
+            if directory in _ENSURED:
+                continue
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                # Parent outside the managed tree is missing, e.g. a custom DATA_DIR
+                os.makedirs(directory, exist_ok=True)
+            _ENSURED.add(directory)
     
     def _setup_derived_paths(self) -> None:
         """Setup derived paths based on base configuration."""
-        if not self.vector_db_path:
-            self.vector_db_path = self.data_dir / "vector_db"
+        # Trusted internal writes, so bypass pydantic's __setattr__
+        data_dir = str(self.paths.data_dir)
+        if not self.db.vector_db_path:
+            object.__setattr__(self.db, "vector_db_path", os.path.join(data_dir, "vector_db"))
         
-        if not self.knowledge_db_path:
-            self.knowledge_db_path = self.data_dir / "knowledge.db"
+        if not self.db.knowledge_db_path:
+            object.__setattr__(self.db, "knowledge_db_path", os.path.join(data_dir, "knowledge.db"))
+        
+        if not self.log.log_file:
+            object.__setattr__(self.log, "log_file", os.path.join(str(self.paths.logs_dir), "system.log"))
+    
+    def validate(self) -> "Settings":
+        """Validate every loaded value, including sections built without validation.
         
-        if not self.log_file:
-            self.log_file = self.logs_dir / "system.log"
+        Raises ``ValidationError`` on bad values.
+        """
+        return type(self).model_validate(self.model_dump())
+    
+    @cached_property
+    def deferred(self) -> DeferredConfig:
+        """Rarely read settings, built on first access."""
+        return DeferredConfig()
+    
+    @cached_property
+    def log_file_path(self) -> Path:
+        """Log file location as a ``Path``."""
+        return Path(self.log.log_file)
     
     @property
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return self.environment == Environment.DEVELOPMENT
+        return self._is_development
     
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.environment == Environment.PRODUCTION
+        return self._is_production
     
     @property
     def is_testing(self) -> bool:
         """Check if running in testing environment."""
-        return self.environment == Environment.TESTING
+        return self._is_testing
+    
+    @property
+    def log_level_int(self) -> int:
+        """Numeric log level for Python logging."""
+        return self._log_level_int
     
     def get_log_level(self) -> int:
         """Get numeric log level for Python logging."""
-        return getattr(logging, self.log_level.value)
+        return self._log_level_int
+    
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Settings as a dictionary, serialized once since settings are frozen."""
+        return self.model_dump(mode="python")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary."""
-        return self.dict()
-    
-    model_config = {
-        "env_file": ".env",
-        "env_file_encoding": "utf-8",
-        "case_sensitive": False,
-        "use_enum_values": True,
-        "validate_assignment": True,
-        "extra": "ignore"
-    }
-
-
-# Global settings instance
-settings = Settings()
-
-# Backward compatibility exports
-BASE_DIR = settings.base_dir
-DATA_DIR = settings.data_dir
-LOGS_DIR = settings.logs_dir
-BACKUPS_DIR = settings.backups_dir
-API_HOST = settings.api_host
-API_PORT = settings.api_port
-# STREAMLIT_HOST = settings.streamlit_host  # Removed - replaced by Next.js frontend
-# STREAMLIT_PORT = settings.streamlit_port  # Removed - replaced by Next.js frontend
-OPENAI_API_KEY = settings.openai_api_key
-ANTHROPIC_API_KEY = settings.anthropic_api_key
-N8N_API_KEY = settings.n8n_api_key
-N8N_BASE_URL = settings.n8n_base_url
-DATABASE_URL = settings.database_url
-VECTOR_DB_PATH = settings.vector_db_path
-KNOWLEDGE_DB_PATH = settings.knowledge_db_path
-LOG_LEVEL = settings.log_level
-LOG_FILE = settings.log_file
-SCRAPER_USER_AGENT = settings.scraper_user_agent
-DEFAULT_AI_PROVIDER = settings.default_ai_provider
+        return self.as_dict
+
+
+# Flat field name -> owning section, exposed as ``Settings.<field>`` below
+_SECTION_FIELDS: Dict[str, str] = {
+    field_name: section
+    for section, info in Settings.model_fields.items()
+    if _is_section(info.annotation)
+    for field_name in info.annotation.model_fields
+}
+_SECTION_FIELDS["cors_origins"] = "api"
+_SECTION_FIELDS.update(dict.fromkeys(DeferredConfig.model_fields, "deferred"))
+
+# Class-level properties, so flat reads like ``settings.api_port`` resolve
+# through normal attribute lookup instead of a ``__getattr__`` fallback
+for _name, _section in _SECTION_FIELDS.items():
+    if _name not in Settings.model_fields and not hasattr(Settings, _name):
+        setattr(Settings, _name, property(attrgetter(f"{_section}.{_name}")))
+del _name, _section
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance, building it on first use."""
+    current = Settings()
+    # Development and CI runs opt in to validating the sections built without it
+    if os.environ.get("ENVIRONMENT", "").lower() == Environment.DEVELOPMENT.value:
+        current.validate()
+    return current
+
+
+# Backward compatibility exports, resolved lazily on first access (PEP 562)
+_COMPAT_MAP = {
+    "BASE_DIR": "base_dir",
+    "DATA_DIR": "data_dir",
+    "LOGS_DIR": "logs_dir",
+    "BACKUPS_DIR": "backups_dir",
+    "API_HOST": "api_host",
+    "API_PORT": "api_port",
+    # "STREAMLIT_HOST": "streamlit_host",  # Removed - replaced by Next.js frontend
+    # "STREAMLIT_PORT": "streamlit_port",  # Removed - replaced by Next.js frontend
+    "OPENAI_API_KEY": "openai_api_key",
+    "ANTHROPIC_API_KEY": "anthropic_api_key",
+    "N8N_API_KEY": "n8n_api_key",
+    "N8N_BASE_URL": "n8n_base_url",
+    "DATABASE_URL": "database_url",
+    "VECTOR_DB_PATH": "vector_db_path",
+    "KNOWLEDGE_DB_PATH": "knowledge_db_path",
+    "LOG_LEVEL": "log_level",
+    "LOG_FILE": "log_file",
+    "SCRAPER_USER_AGENT": "scraper_user_agent",
+    "DEFAULT_AI_PROVIDER": "default_ai_provider",
+}
+
+# All legacy constants, built in one pass for the current settings instance
+_compat: Optional[SimpleNamespace] = None
+
+
+def _plain(value: Any) -> Any:
+    """Unwrap secrets, which the legacy constants exposed as plain strings."""
+    return value.get_secret_value() if isinstance(value, SecretStr) else value
+
+
+def _compat_namespace() -> SimpleNamespace:
+    """Get the legacy constants, rebuilding them if the settings were reloaded."""
+    global _compat
+    current = get_settings()
+    if _compat is None or _compat.settings is not current:
+        _compat = SimpleNamespace(
+            settings=current,
+            **{name: _plain(getattr(current, attr)) for name, attr in _COMPAT_MAP.items()},
+        )
+    return _compat
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``settings`` and the legacy module constants on demand."""
+    if name == "settings":
+        return get_settings()
+    if name not in _COMPAT_MAP:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(_compat_namespace(), name)
@@ -24,6 +24,9 @@ DROP TABLE IF EXISTS docs_1_0_migration_checklist CASCADE;
 -- Enable UUID extension
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- Enable trigram matching for title search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Unified Documents Table
 -- This table handles both scraped documentation and workflow documents
 CREATE TABLE IF NOT EXISTS unified_documents (
@@ -118,7 +121,7 @@ CREATE TABLE IF NOT EXISTS unified_chunks (
     integrations JSONB DEFAULT '[]'::jsonb,
     
     -- Vector Embeddings
-    embedding JSONB,
+    embedding REAL[],
     embedding_model VARCHAR(128),
     
     -- Timestamps
@@ -244,14 +247,21 @@ CREATE INDEX IF NOT EXISTS idx_unified_documents_source ON unified_documents(sou
 CREATE INDEX IF NOT EXISTS idx_unified_documents_category ON unified_documents(category);
 CREATE INDEX IF NOT EXISTS idx_unified_documents_subcategory ON unified_documents(subcategory);
 CREATE INDEX IF NOT EXISTS idx_unified_documents_title ON unified_documents(title);
-CREATE INDEX IF NOT EXISTS idx_unified_documents_content_hash ON unified_documents(content_hash);
+CREATE INDEX IF NOT EXISTS idx_unified_documents_content_hash_covering ON unified_documents(content_hash) INCLUDE (id, is_processed, updated_at) WITH (fillfactor = 90);
 CREATE INDEX IF NOT EXISTS idx_unified_documents_workflow_id ON unified_documents(workflow_id) WHERE workflow_id IS NOT NULL;
-CREATE INDEX IF NOT EXISTS idx_unified_documents_url ON unified_documents(url) WHERE url IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_unified_documents_url_covering ON unified_documents(url) INCLUDE (id, quality_score) WITH (fillfactor = 90) WHERE url IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_unified_documents_file_path ON unified_documents(file_path) WHERE file_path IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_unified_documents_file_name ON unified_documents(file_name) WHERE file_name IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_unified_documents_processed ON unified_documents(is_processed, created_at);
 CREATE INDEX IF NOT EXISTS idx_unified_documents_created_at ON unified_documents(created_at);
 CREATE INDEX IF NOT EXISTS idx_unified_documents_updated_at ON unified_documents(updated_at);
+CREATE INDEX IF NOT EXISTS idx_unified_documents_type_category ON unified_documents(document_type, category);
+CREATE INDEX IF NOT EXISTS idx_unified_documents_type_created_at ON unified_documents(document_type, created_at);
+CREATE INDEX IF NOT EXISTS idx_unified_documents_node_types_gin ON unified_documents USING GIN (node_types jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_unified_documents_integrations_gin ON unified_documents USING GIN (integrations jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_unified_documents_metadata_gin ON unified_documents USING GIN (metadata jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_unified_documents_tags_gin ON unified_documents USING GIN (tags jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_unified_documents_title_trgm ON unified_documents USING GIN (title gin_trgm_ops);
 
 -- Unified Chunks Indexes
 CREATE INDEX IF NOT EXISTS idx_unified_chunks_document_id ON unified_chunks(document_id);
@@ -0,0 +1,33 @@
+"""Store chunk embeddings as REAL[]
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # JSON arrays become float4 arrays; any other JSON value becomes NULL
+    op.execute("""
+        ALTER TABLE unified_chunks ALTER COLUMN embedding TYPE REAL[] USING (
+            CASE WHEN jsonb_typeof(embedding) = 'array'
+                 THEN translate(embedding::text, '[]', '{}')::REAL[]
+            END
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        ALTER TABLE unified_chunks ALTER COLUMN embedding TYPE JSONB USING to_jsonb(embedding)
+    """)
@@ -0,0 +1,71 @@
+"""Add search, covering and per-type indexes on unified_documents
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, index definition)
+_INDEXES = [
+    # Per-type access paths
+    ("ix_unified_documents_type_category", "unified_documents", "(document_type, category)"),
+    ("ix_unified_documents_type_created_at", "unified_documents", "(document_type, created_at)"),
+    ("ix_unified_documents_file_path_partial", "unified_documents", "(file_path) WHERE file_path IS NOT NULL"),
+    ("ix_unified_documents_workflow_id_partial", "unified_documents", "(workflow_id) WHERE workflow_id IS NOT NULL"),
+
+    # Covering lookups, answered by index-only scans
+    ("ix_unified_documents_url_covering", "unified_documents",
+     "(url) INCLUDE (id, quality_score) WITH (fillfactor = 90) WHERE url IS NOT NULL"),
+    ("ix_unified_documents_content_hash_covering", "unified_documents",
+     "(content_hash) INCLUDE (id, is_processed, updated_at) WITH (fillfactor = 90)"),
+
+    # JSONB containment, tag and title search
+    ("ix_unified_documents_node_names_gin", "unified_documents", "USING GIN (node_names jsonb_path_ops)"),
+    ("ix_unified_documents_node_types_gin", "unified_documents", "USING GIN (node_types jsonb_path_ops)"),
+    ("ix_unified_documents_integrations_gin", "unified_documents", "USING GIN (integrations jsonb_path_ops)"),
+    ("ix_unified_documents_metadata_gin", "unified_documents", "USING GIN (document_metadata jsonb_path_ops)"),
+    ("ix_unified_documents_tags_gin", "unified_documents", "USING GIN (tags)"),
+    ("ix_unified_documents_title_trgm", "unified_documents", "USING GIN (title gin_trgm_ops)"),
+]
+
+# Revision 001 indexes made redundant by the ones above, with their definitions for downgrade
+_REPLACED_INDEXES = [
+    ("ix_unified_documents_url", "unified_documents", "(url)"),
+    ("ix_unified_documents_content_hash", "unified_documents", "(content_hash)"),
+    ("ix_unified_documents_file_path", "unified_documents", "(file_path)"),
+    ("ix_unified_documents_workflow_id", "unified_documents", "(workflow_id)"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Build indexes outside the migration transaction so they don't lock writes
+    with op.get_context().autocommit_block():
+        op.execute("SET max_parallel_maintenance_workers = 4")
+        op.execute("SET maintenance_work_mem = '512MB'")
+        for name, table, definition in _INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+        op.execute("RESET maintenance_work_mem")
+        op.execute("RESET max_parallel_maintenance_workers")
+
+        for name, _table, _definition in _REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, definition in _REPLACED_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+        for name, _table, _definition in reversed(_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -5,8 +5,8 @@ This script maintains backward compatibility by allowing users to run
 the system startup from the project root directory.
 """
 
+import os
 import sys
-import subprocess
 from pathlib import Path
 
 def main():
@@ -17,16 +17,9 @@ def main():
         print(f"Error: Could not find {script_path}")
         sys.exit(1)
     
-    # Pass all arguments to the actual script
+    # Replace this process with the actual script, passing all arguments
     cmd = [sys.executable, str(script_path)] + sys.argv[1:]
-    
-    try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        sys.exit(e.returncode)
-    except KeyboardInterrupt:
-        print("\nInterrupted by user")
-        sys.exit(1)
+    os.execv(sys.executable, cmd)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
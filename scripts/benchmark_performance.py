@@ -8,9 +8,15 @@ Benchmarks the knowledge base loading performance with and without optimizations
 import time
 import sys
 import os
+import multiprocessing
+import timeit
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -26,32 +32,96 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@contextmanager
+def measure() -> Iterator[Dict[str, float]]:
+    """Time a block with perf_counter_ns
+    
+    Memory is measured by peak_memory in a separate run, so tracing
+    overhead stays out of the timings.
+    """
+    stats: Dict[str, float] = {}
+    start_ns = time.perf_counter_ns()
+    try:
+        yield stats
+    finally:
+        stats['elapsed'] = (time.perf_counter_ns() - start_ns) / 1e9
+
+def peak_memory(func) -> int:
+    """Peak traced allocation of one untimed call to func"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def cold_peak_memory(func, *args) -> int:
+    """Peak traced allocation of one call to func(*args) in a fresh interpreter
+    
+    The agent manager is a process-wide singleton, so once a benchmark has
+    loaded the agent every later call in this process is a lookup. A spawned
+    process starts with an empty manager and measures the load itself.
+    """
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(peak_memory, partial(func, *args)).result()
+
+def time_repeated(func, number: int = 1000, repeat: int = 5) -> float:
+    """Best per-call time of a fast path over repeated loops, as timeit reports it"""
+    # The cache-hit paths log on every call; keep that I/O out of the loop
+    logging.disable(logging.INFO)
+    try:
+        return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    finally:
+        logging.disable(logging.NOTSET)
+
+def load_original(data_directory: str):
+    """Create agent without optimizations"""
+    return get_expert_agent(data_directory)
+
+def load_optimized(data_directory: str, force_refresh: bool = False):
+    """Load the agent through the optimized agent manager"""
+    agent_manager = get_agent_manager()
+    
+    # Clear cache and drop the loaded agent if force refresh
+    if force_refresh:
+        cache = KnowledgeCache(data_directory)
+        cache.invalidate_cache()
+        agent_manager.invalidate_cache()
+    
+    # Use optimized agent manager
+    return agent_manager.get_expert_agent(data_directory)
+
+def load_singleton(data_directory: str):
+    """Look the agent up three times through the agent manager"""
+    agent_manager = get_agent_manager()
+    return (
+        agent_manager.get_expert_agent(data_directory),
+        agent_manager.get_expert_agent(data_directory),
+        agent_manager.get_expert_agent(data_directory),
+    )
+
 def benchmark_original_loading(data_directory: str = "data/scraped_docs") -> Dict[str, Any]:
     """Benchmark original loading without optimizations"""
     logger.info("Benchmarking original loading method...")
     
-    start_time = time.time()
-    
     try:
-        # Create agent without optimizations
-        agent = get_expert_agent(data_directory)
-        
-        end_time = time.time()
-        loading_time = end_time - start_time
+        with measure() as stats:
+            agent = load_original(data_directory)
         
         return {
             'method': 'original',
-            'loading_time': loading_time,
+            'loading_time': stats['elapsed'],
+            'peak_bytes': cold_peak_memory(load_original, data_directory),
             'chunks_loaded': len(agent.knowledge_chunks),
             'categories': len(agent.categories),
             'success': True
         }
         
     except Exception as e:
-        end_time = time.time()
         return {
             'method': 'original',
-            'loading_time': end_time - start_time,
+            'loading_time': stats['elapsed'],
             'error': str(e),
             'success': False
         }
@@ -60,24 +130,14 @@ def benchmark_optimized_loading(data_directory: str = "data/scraped_docs", force
     """Benchmark optimized loading with caching"""
     logger.info(f"Benchmarking optimized loading method (force_refresh={force_refresh})...")
     
-    start_time = time.time()
-    
     try:
-        # Clear cache if force refresh
-        if force_refresh:
-            cache = KnowledgeCache(data_directory)
-            cache.invalidate_cache()
-        
-        # Use optimized agent manager
-        agent_manager = get_agent_manager()
-        agent = agent_manager.get_expert_agent(data_directory)
-        
-        end_time = time.time()
-        loading_time = end_time - start_time
+        with measure() as stats:
+            agent = load_optimized(data_directory, force_refresh)
         
         return {
             'method': 'optimized',
-            'loading_time': loading_time,
+            'loading_time': stats['elapsed'],
+            'peak_bytes': cold_peak_memory(load_optimized, data_directory, force_refresh),
             'chunks_loaded': len(agent.knowledge_chunks),
             'categories': len(agent.categories),
             'force_refresh': force_refresh,
@@ -85,10 +145,9 @@ def benchmark_optimized_loading(data_directory: str = "data/scraped_docs", force
         }
         
     except Exception as e:
-        end_time = time.time()
         return {
             'method': 'optimized',
-            'loading_time': end_time - start_time,
+            'loading_time': stats['elapsed'],
             'force_refresh': force_refresh,
             'error': str(e),
             'success': False
@@ -100,27 +159,51 @@ def benchmark_cache_performance(data_directory: str = "data/scraped_docs") -> Di
     
     cache = KnowledgeCache(data_directory)
     
+    def first_load():
+        cache.invalidate_cache()
+        return cache.get_knowledge_base(force_refresh=True)
+    
+    second_load = lambda: cache.get_knowledge_base(force_refresh=False)
+    
     # First load (cache miss)
-    cache.invalidate_cache()
-    start_time = time.time()
-    knowledge_base_1 = cache.get_knowledge_base(force_refresh=True)
-    first_load_time = time.time() - start_time
+    with measure() as first:
+        knowledge_base_1 = first_load()
+    first_load_time = first['elapsed']
+    first_peak_bytes = peak_memory(first_load)
     
-    # Second load (cache hit)
-    start_time = time.time()
-    knowledge_base_2 = cache.get_knowledge_base(force_refresh=False)
-    second_load_time = time.time() - start_time
+    # Second load (cache hit), timed over repeated loops since a single hit is sub-millisecond
+    knowledge_base_2 = second_load()
+    second_load_time = time_repeated(second_load)
     
     return {
         'method': 'cache_comparison',
         'first_load_time': first_load_time,
         'second_load_time': second_load_time,
+        'first_peak_bytes': first_peak_bytes,
+        'second_peak_bytes': peak_memory(second_load),
         'speedup_factor': first_load_time / second_load_time if second_load_time > 0 else float('inf'),
         'chunks_loaded': len(knowledge_base_1.chunks) if knowledge_base_1 else 0,
         'cache_working': knowledge_base_1 is not None and knowledge_base_2 is not None,
         'success': True
     }
 
+def benchmark_singleton(data_directory: str = "data/scraped_docs") -> Dict[str, Any]:
+    """Benchmark repeated agent lookups through the agent manager"""
+    logger.info("Benchmarking singleton agent lookups...")
+    
+    with measure() as stats:
+        agent1, agent2, agent3 = load_singleton(data_directory)
+    
+    agent_manager = get_agent_manager()
+    return {
+        'method': 'singleton_test',
+        'loading_time': stats['elapsed'],
+        'lookup_time': time_repeated(lambda: agent_manager.get_expert_agent(data_directory)),
+        'peak_bytes': cold_peak_memory(load_singleton, data_directory),
+        'agents_identical': agent1 is agent2 is agent3,
+        'success': True
+    }
+
 def run_comprehensive_benchmark(data_directory: str = "data/scraped_docs") -> Dict[str, Any]:
     """Run comprehensive performance benchmark"""
     logger.info("Starting comprehensive performance benchmark...")
@@ -138,7 +221,7 @@ def run_comprehensive_benchmark(data_directory: str = "data/scraped_docs") -> Di
     
     if cache_results['success']:
         logger.info(f"First load (cache miss): {cache_results['first_load_time']:.2f}s")
-        logger.info(f"Second load (cache hit): {cache_results['second_load_time']:.2f}s")
+        logger.info(f"Second load (cache hit): {cache_results['second_load_time'] * 1000:.3f}ms")
         logger.info(f"Speedup factor: {cache_results['speedup_factor']:.1f}x")
     
     # Test 2: Optimized loading (fresh)
@@ -161,24 +244,10 @@ def run_comprehensive_benchmark(data_directory: str = "data/scraped_docs") -> Di
     
     # Test 4: Multiple agent instances (singleton test)
     logger.info("\n=== Test 4: Singleton Pattern Test ===")
-    start_time = time.time()
-    
-    agent_manager = get_agent_manager()
-    agent1 = agent_manager.get_expert_agent(data_directory)
-    agent2 = agent_manager.get_expert_agent(data_directory)
-    agent3 = agent_manager.get_expert_agent(data_directory)
-    
-    singleton_time = time.time() - start_time
-    
-    singleton_results = {
-        'method': 'singleton_test',
-        'loading_time': singleton_time,
-        'agents_identical': agent1 is agent2 is agent3,
-        'success': True
-    }
+    singleton_results = benchmark_singleton(data_directory)
     results['tests'].append(singleton_results)
     
-    logger.info(f"Multiple agent creation: {singleton_time:.2f}s")
+    logger.info(f"Multiple agent creation: {singleton_results['loading_time']:.2f}s")
     logger.info(f"Agents are identical (singleton): {singleton_results['agents_identical']}")
     
     results['benchmark_end'] = time.time()
@@ -186,6 +255,10 @@ def run_comprehensive_benchmark(data_directory: str = "data/scraped_docs") -> Di
     
     return results
 
+def format_bytes(num_bytes: float) -> str:
+    """Format a byte count in MB"""
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
 def print_summary(results: Dict[str, Any]):
     """Print benchmark summary"""
     print("\n" + "="*60)
@@ -202,15 +275,19 @@ def print_summary(results: Dict[str, Any]):
             if method == 'cache_comparison':
                 print(f"Cache Performance:")
                 print(f"  - First load: {test['first_load_time']:.2f}s")
-                print(f"  - Second load: {test['second_load_time']:.2f}s")
+                print(f"  - Second load: {test['second_load_time'] * 1000:.3f}ms")
                 print(f"  - Speedup: {test['speedup_factor']:.1f}x")
                 print(f"  - Chunks: {test['chunks_loaded']}")
+                print(f"  - Peak memory: {format_bytes(test['first_peak_bytes'])} / {format_bytes(test['second_peak_bytes'])}")
             elif method == 'optimized':
                 cache_status = "(fresh)" if test['force_refresh'] else "(cached)"
                 print(f"Optimized Loading {cache_status}: {test['loading_time']:.2f}s")
+                print(f"  - Peak memory: {format_bytes(test['peak_bytes'])}")
             elif method == 'singleton_test':
                 print(f"Singleton Pattern: {test['loading_time']:.2f}s (multiple instances)")
+                print(f"  - Repeated lookup: {test['lookup_time'] * 1e6:.2f}µs per call")
                 print(f"  - Singleton working: {test['agents_identical']}")
+                print(f"  - Peak memory: {format_bytes(test['peak_bytes'])}")
         else:
             print(f"Test {test['method']} failed: {test.get('error', 'Unknown error')}")
         print()
@@ -250,7 +327,7 @@ def main():
         results = benchmark_cache_performance(args.data_dir)
         print(f"\nQuick Benchmark Results:")
         print(f"First load: {results['first_load_time']:.2f}s")
-        print(f"Second load: {results['second_load_time']:.2f}s")
+        print(f"Second load: {results['second_load_time'] * 1000:.3f}ms")
         print(f"Speedup: {results['speedup_factor']:.1f}x")
     else:
         results = run_comprehensive_benchmark(args.data_dir)
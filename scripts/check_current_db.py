@@ -45,14 +45,19 @@ async def check_database():
                 count = result.fetchone()[0]
                 print(f"\n🧩 workflow_chunks: {count} records")
             
-            # Check if category tables exist
-            category_tables = [t for t in tables if t.startswith('docs_')]
+            # Check if category tables exist; row counts are the live-tuple
+            # estimates from the statistics collector, read in one query
+            result = await session.execute(
+                text(
+                    "SELECT relname, n_live_tup FROM pg_stat_user_tables "
+                    "WHERE schemaname = 'public' AND relname LIKE 'docs\\_%' ORDER BY relname"
+                )
+            )
+            category_tables = result.fetchall()
             if category_tables:
                 print(f"\n📂 Category tables ({len(category_tables)}):")
-                for table in sorted(category_tables):
-                    result = await session.execute(text(f"SELECT COUNT(*) FROM {table}"))
-                    count = result.fetchone()[0]
-                    print(f"   {table}: {count} records")
+                for table, count in category_tables:
+                    print(f"   {table}: ~{count} records")
             else:
                 print(f"\n❌ No category tables found (docs_* pattern)")
                 
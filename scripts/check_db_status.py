@@ -1,62 +1,141 @@
 #!/usr/bin/env python3
 import asyncio
+import pickle
+import sys
+from itertools import islice
+from pathlib import Path
 from src.n8n_scraper.database.connection import db_manager
-from sqlalchemy import inspect, text
+from sqlalchemy import inspect
+
+def _tables_and_version(sync_conn):
+    """Table names plus the Alembic version, if the version table exists."""
+    # A set, since callers only test membership and sort for display
+    tables = frozenset(inspect(sync_conn).get_table_names())
+    version = None
+    if 'alembic_version' in tables:
+        # One-off query; go straight to the DBAPI cursor and skip statement compilation
+        cursor = sync_conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT version_num FROM alembic_version")
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+        version = row[0] if row else None
+    return tables, version
+
+def _columns(sync_conn):
+    return inspect(sync_conn).get_multi_columns(schema=None)
+
+def _indexes(sync_conn):
+    return inspect(sync_conn).get_multi_indexes(schema=None)
+
+# Table summaries from the last run, reused while the schema is unchanged
+_SCHEMA_CACHE = Path("~/.cache/n8n_scraper/schema.pkl").expanduser()
+
+def _schema_key(tables, version):
+    return version, tuple(sorted(tables))
+
+def _load_schema_cache(key):
+    """Cached table summaries for this schema, or None."""
+    try:
+        with open(_SCHEMA_CACHE, 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    return cached["tables"] if cached.get("key") == key else None
+
+def _save_schema_cache(key, summary):
+    _SCHEMA_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    with open(_SCHEMA_CACHE, 'wb') as f:
+        pickle.dump({"key": key, "tables": summary}, f)
+
+def _summarize(tables, cols_by_table, idx_by_table):
+    """{table: (column count, index count, first five (name, type) pairs of workflow tables)}"""
+    summary = {}
+    # Stringify each distinct type object once; the reflected columns keep them alive
+    type_names = {}
+    for table in tables:
+        columns = cols_by_table[(None, table)]
+        # Only workflow tables show their columns
+        preview = []
+        if 'workflow' in table:
+            for col in islice(columns, 5):
+                col_type = col['type']
+                type_name = type_names.get(id(col_type))
+                if type_name is None:
+                    type_name = type_names[id(col_type)] = str(col_type)
+                preview.append((col['name'], type_name))
+        summary[table] = (len(columns), len(idx_by_table[(None, table)]), preview)
+    return summary
+
+async def _run_on_connection(engine, fn):
+    """Run a sync inspector function on its own pooled async connection."""
+    async with engine.connect() as conn:
+        return await conn.run_sync(fn)
 
 async def check_database_status():
+    # Collect the report and write it once rather than print line by line
+    out = []
     try:
         # Initialize database connection
         await db_manager.initialize()
-        
-        print("=== Database Status Check ===")
-        print(f"Database initialized: {db_manager.is_initialized}")
-        
-        if db_manager.sync_engine:
-            print(f"Database URL: {str(db_manager.sync_engine.url).replace(db_manager.sync_engine.url.password or '', '***')}")
-            
-            # Check connection
-            with db_manager.sync_engine.connect() as conn:
-                result = conn.execute(text("SELECT 1"))
-                print("Connection test: ✅ SUCCESS")
-                
-                # Get table information
-                inspector = inspect(conn)
-                tables = inspector.get_table_names()
-                
-                print(f"\n=== Tables ({len(tables)}) ===")
-                for table in sorted(tables):
-                    columns = inspector.get_columns(table)
-                    indexes = inspector.get_indexes(table)
-                    print(f"  📋 {table}:")
-                    print(f"     - Columns: {len(columns)}")
-                    print(f"     - Indexes: {len(indexes)}")
-                    
-                    # Show column details for workflow tables
-                    if 'workflow' in table:
-                        print(f"     - Column details:")
-                        for col in columns[:5]:  # Show first 5 columns
-                            print(f"       • {col['name']} ({col['type']})")
-                        if len(columns) > 5:
-                            print(f"       • ... and {len(columns) - 5} more columns")
-                
-                # Check migration status
-                if 'alembic_version' in tables:
-                    result = conn.execute(text("SELECT version_num FROM alembic_version"))
-                    version = result.fetchone()
-                    if version:
-                        print(f"\n=== Migration Status ===")
-                        print(f"Current migration version: {version[0]}")
-                    else:
-                        print(f"\n=== Migration Status ===")
-                        print("No migrations applied yet")
-                        
+
+        out.append("=== Database Status Check ===")
+        out.append(f"Database initialized: {db_manager.is_initialized}")
+
+        engine = db_manager.async_engine
+        if engine:
+            out.append(f"Database URL: {engine.url.render_as_string(hide_password=True)}")
+
+            tables, version = await _run_on_connection(engine, _tables_and_version)
+            out.append("Connection test: ✅ SUCCESS")
+
+            # Full reflection only when the migration version or table set changed
+            key = _schema_key(tables, version)
+            summary = _load_schema_cache(key)
+            if summary is None:
+                # One connection can only run one query at a time, so each lookup
+                # gets its own and the catalog round trips overlap
+                cols_by_table, idx_by_table = await asyncio.gather(
+                    _run_on_connection(engine, _columns),
+                    _run_on_connection(engine, _indexes),
+                )
+                summary = _summarize(tables, cols_by_table, idx_by_table)
+                _save_schema_cache(key, summary)
+
+            out.append(f"\n=== Tables ({len(tables)}) ===")
+            for table in sorted(tables):
+                column_count, index_count, preview = summary[table]
+                out.append(f"  📋 {table}:")
+                out.append(f"     - Columns: {column_count}")
+                out.append(f"     - Indexes: {index_count}")
+
+                # Show column details for workflow tables
+                if 'workflow' in table:
+                    out.append(f"     - Column details:")
+                    for name, type_name in preview:  # Show first 5 columns
+                        out.append(f"       • {name} ({type_name})")
+                    if column_count > 5:
+                        out.append(f"       • ... and {column_count - 5} more columns")
+
+            # Check migration status
+            if 'alembic_version' in tables:
+                if version:
+                    out.append(f"\n=== Migration Status ===")
+                    out.append(f"Current migration version: {version}")
+                else:
+                    out.append(f"\n=== Migration Status ===")
+                    out.append("No migrations applied yet")
+
         else:
-            print("❌ Database engine not available")
-            
+            out.append("❌ Database engine not available")
+
     except Exception as e:
-        print(f"❌ Database check failed: {e}")
+        out.append(f"❌ Database check failed: {e}")
         return False
-    
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
     return True
 
 if __name__ == '__main__':
@@ -17,21 +17,540 @@ import sys
 import json
 import logging
 import argparse
+import atexit
+import mmap
+import pickle
+import queue
 import shutil
+import threading
+import time
 from datetime import datetime
+from logging.handlers import MemoryHandler
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
-from collections import defaultdict
+from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Dict, Iterator, List, Any, Tuple, Optional, Union
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.n8n_scraper.database.connection import DatabaseManager
-from src.n8n_scraper.database.unified_models import UnifiedDocument, UnifiedChunk
-from sqlalchemy import text
 import hashlib
 import re
 
+# The database stack is only needed for import; validating and fixing
+# files work without it
+if TYPE_CHECKING:
+    from src.n8n_scraper.database.connection import DatabaseManager
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Duplicate detection only hashes whole files whose size and leading bytes collide
+_PREFIX_BYTES = 4096
+_HASH_CHUNK = 1 << 20
+_MMAP_THRESHOLD = 128 * 1024
+
+_WORKFLOW_SUFFIXES = ('.json', '.txt')
+
+# Fix backups are written under base_path; they are never scanned as workflows
+_BACKUPS_DIR = 'backups'
+
+# JSON repairs applied by _fix_json_file
+_RE_TRAIL_OBJ = re.compile(r',\s*}')
+_RE_TRAIL_ARR = re.compile(r',\s*]')
+_RE_QUOTES = re.compile(r'"([^"]*?)"([^"]*?)"([^"]*?)"')
+
+# Category keywords, in priority order, with the category names already titled
+_CATEGORY_KEYWORDS = tuple((category.title(), tuple(keywords)) for category, keywords in {
+    'email': ['email', 'gmail', 'outlook', 'smtp', 'imap'],
+    'communication': ['slack', 'discord', 'telegram', 'whatsapp', 'teams'],
+    'crm': ['hubspot', 'salesforce', 'pipedrive', 'zoho'],
+    'ecommerce': ['shopify', 'woocommerce', 'stripe', 'paypal'],
+    'cloud': ['aws', 'azure', 'gcp', 'google cloud'],
+    'data': ['database', 'mysql', 'postgres', 'mongodb', 'airtable'],
+    'monitoring': ['prometheus', 'grafana', 'datadog', 'newrelic'],
+    'api': ['rest', 'graphql', 'webhook', 'http request'],
+    'automation': ['cron', 'schedule', 'trigger', 'automation'],
+    'social': ['twitter', 'facebook', 'linkedin', 'instagram'],
+    'productivity': ['notion', 'trello', 'asana', 'jira']
+}.items())
+
+# The import's writer thread inserts up to this many workflows per
+# transaction, or whatever arrived within the flush interval
+_IMPORT_BATCH_SIZE = 1000
+_IMPORT_FLUSH_SECONDS = 0.5
+
+# Analyzed workflows waiting for the writer thread
+_IMPORT_QUEUE_SIZE = 5000
+
+# Files handed to the worker pools ahead of the loop consuming their results
+_POOL_WINDOW = 256
+
+# Threads writing fixed files back to disk
+_FILE_WRITERS = 32
+
+# Workflow analyses from the last import, keyed by (content hash, is JSON);
+# bump the version when the analysis itself changes
+_ANALYSIS_CACHE = Path("~/.cache/n8n_scraper/analysis.pkl").expanduser()
+_ANALYSIS_CACHE_VERSION = 1
+
+# Analyses this worker process can reuse instead of recomputing
+_known_analyses: Dict[Tuple[str, bool], Dict[str, Any]] = {}
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize JSON to UTF-8 bytes with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+def _json_column(obj: Any) -> str:
+    """Serializer for JSONB columns on the import engine"""
+    return _dumps(obj).decode('utf-8')
+
+def _content_hash(data: bytes) -> str:
+    """128-bit BLAKE2b hex digest, the same width as the MD5 it replaces"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _hash_file(file_path: Path, limit: Optional[int] = None) -> str:
+    """Hash a file, or only its first ``limit`` bytes
+    
+    Large files are hashed straight from a memory map; smaller ones are
+    streamed in chunks, so neither is copied into one Python buffer.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb', buffering=0) as f:
+        if limit is not None:
+            hasher.update(f.read(limit))
+        elif os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        else:
+            while chunk := f.read(_HASH_CHUNK):
+                hasher.update(chunk)
+    return hasher.hexdigest()
+
+def _iter_workflow_files(root: Path) -> Iterator[os.DirEntry]:
+    """Walk ``root`` once with scandir, yielding workflow file entries
+    
+    Entry types come from the directory listing, so no per-file stat is needed.
+    The backups directory under ``root`` is skipped.
+    """
+    backups = os.path.join(root, _BACKUPS_DIR)
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path != backups:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(_WORKFLOW_SUFFIXES):
+                        yield entry
+        except FileNotFoundError:
+            continue
+
+def _read_workflow(file_path: Path) -> Tuple[bytes, Optional[Any], Optional[ValueError]]:
+    """Read a workflow file once, parsing it if it is JSON
+    
+    Returns the raw bytes, the parsed data (None for text files or JSON that
+    does not parse) and the decode error that stopped parsing, if any.
+    """
+    raw = file_path.read_bytes()
+    if file_path.suffix.lower() != '.json':
+        return raw, None, None
+    try:
+        return raw, _loads(raw.decode('utf-8')), None
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        return raw, None, e
+
+def _validate_single_file(file_path: Path, raw: bytes, data: Optional[Any],
+                          parse_error: Optional[ValueError]) -> Dict[str, Any]:
+    """Validate a single workflow file"""
+    result = {'valid': True, 'errors': [], 'warnings': []}
+
+    # Check file size
+    file_size = len(raw)
+    if file_size == 0:
+        result['valid'] = False
+        result['errors'].append({'file': str(file_path), 'error': 'Empty file'})
+        return result
+
+    if file_size > 1024 * 1024:  # 1MB
+        result['warnings'].append({'file': str(file_path), 'warning': f'Large file ({file_size} bytes)'})
+
+    # For JSON files, validate JSON structure
+    if file_path.suffix.lower() == '.json':
+        if isinstance(parse_error, UnicodeDecodeError):
+            result['valid'] = False
+            result['errors'].append({'file': str(file_path), 'error': f'Encoding error: {str(parse_error)}'})
+        elif parse_error is not None:
+            result['valid'] = False
+            result['errors'].append({'file': str(file_path), 'error': f'Invalid JSON: {str(parse_error)}'})
+
+        # Check for required fields in workflow JSON
+        elif isinstance(data, dict):
+            if not data.get('nodes'):
+                result['errors'].append({'file': str(file_path), 'error': 'Missing required field: nodes'})
+                result['valid'] = False
+
+            if not data.get('connections'):
+                result['errors'].append({'file': str(file_path), 'error': 'Missing required field: connections'})
+                result['valid'] = False
+
+            # Check for default/empty names
+            name = data.get('name', '')
+            if not name or name in ['My workflow', 'New workflow', '']:
+                result['warnings'].append({'file': str(file_path), 'warning': 'Default or empty workflow name'})
+
+    return result
+
+def _fix_json_file(file_path: Path, raw: bytes, data: Optional[Any],
+                   parse_error: Optional[ValueError]) -> Tuple[Optional[Any], Optional[str]]:
+    """Fix common JSON syntax errors
+
+    Returns the parsed data (None if the file cannot be read or repaired)
+    and the repaired text if a repair was needed.
+    """
+    if parse_error is None:
+        return data, None  # Already valid
+
+    try:
+        content = raw.decode('utf-8')
+
+        # Common fixes
+        original_content = content
+
+        # Remove trailing commas
+        if ',' in content:
+            if '}' in content:
+                content = _RE_TRAIL_OBJ.sub('}', content)
+            if ']' in content:
+                content = _RE_TRAIL_ARR.sub(']', content)
+
+        # Trailing commas are the usual culprit; try them before the quote fix
+        if content != original_content:
+            try:
+                data = _loads(content)
+                logger.info(f"Repaired JSON syntax in: {file_path}")
+                return data, content
+            except json.JSONDecodeError:
+                pass
+
+        # Fix unescaped quotes in strings; the pattern needs at least four quotes
+        if content.count('"') >= 4:
+            content = _RE_QUOTES.sub(r'"\1\"\2\"\3"', content)
+
+        # Try to parse fixed content
+        try:
+            data = _loads(content)
+            logger.info(f"Repaired JSON syntax in: {file_path}")
+            return data, content
+        except json.JSONDecodeError:
+            return None, None
+
+    except Exception as e:
+        logger.error(f"Error fixing JSON in {file_path}: {e}")
+        return None, None
+
+def _add_missing_fields(file_path: Path, data: Any) -> bool:
+    """Add missing required fields to parsed workflow JSON in place"""
+    try:
+        if not isinstance(data, dict):
+            return False
+
+        modified = False
+
+        # Add missing nodes field
+        if 'nodes' not in data:
+            data['nodes'] = []
+            modified = True
+
+        # Add missing connections field
+        if 'connections' not in data:
+            data['connections'] = {}
+            modified = True
+
+        if modified:
+            logger.info(f"Added missing fields to: {file_path}")
+            return True
+
+        return False
+
+    except Exception as e:
+        logger.error(f"Error adding fields to {file_path}: {e}")
+        return False
+
+def _analyze_workflow_json(data: dict, file_path: Path, file_hash: str) -> Dict[str, Any]:
+    """Analyze JSON workflow data"""
+    # Extract content parts
+    content_parts = []
+
+    # Add workflow name - ensure it's not empty and not too long
+    name = data.get('name', file_path.stem)
+    if not name or name.strip() == '':
+        name = file_path.stem
+    if not name or name.strip() == '':
+        name = 'Unnamed Workflow'
+
+    # Truncate name if too long (max 120 chars to leave room for safety)
+    if len(name) > 120:
+        name = name[:120]
+
+    content_parts.append(f"Workflow: {name}")
+
+    # Add description if available
+    if data.get('meta', {}).get('description'):
+        content_parts.append(f"Description: {data['meta']['description']}")
+
+    # Add node information
+    nodes = data.get('nodes', [])
+    if nodes:
+        content_parts.append(f"Nodes ({len(nodes)}):")
+        for node in nodes:
+            node_type = node.get('type', 'Unknown')
+            node_name = node.get('name', node.get('id', 'Unnamed'))
+            content_parts.append(f"- {node_name} ({node_type})")
+
+    # Add tags
+    tags = data.get('tags', [])
+    if tags:
+        tag_names = []
+        for tag in tags:
+            if isinstance(tag, dict):
+                tag_names.append(tag.get('name', str(tag)))
+            else:
+                tag_names.append(str(tag))
+        content_parts.append(f"Tags: {', '.join(tag_names)}")
+
+    # Ensure all parts are strings
+    content_parts = [str(part) for part in content_parts]
+    content = '\n'.join(content_parts)
+
+    return {
+        'name': name,
+        'content': content,
+        'category': _determine_category(data, content),
+        'file_hash': file_hash,
+        'raw_data': data,
+        'metadata': {
+            'node_count': len(nodes),
+            'has_description': bool(data.get('meta', {}).get('description')),
+            'tags': [str(tag) if not isinstance(tag, dict) else tag.get('name', str(tag)) for tag in tags]
+        }
+    }
+
+def _text_workflow_name(file_path: Path) -> str:
+    """Workflow name for a text file, taken from its file name"""
+    # Handle name - ensure it's not empty and not too long
+    name = file_path.stem
+    if not name or name.strip() == '':
+        name = 'Unnamed Workflow'
+
+    # Truncate name if too long (max 120 chars to leave room for safety)
+    if len(name) > 120:
+        name = name[:120]
+
+    return name
+
+def _analyze_workflow_text(content: str, file_path: Path, file_hash: str) -> Dict[str, Any]:
+    """Analyze text workflow content"""
+    return {
+        'name': _text_workflow_name(file_path),
+        'content': content,
+        'category': _determine_category({}, content),
+        'file_hash': file_hash,
+        'raw_data': {'content': content, 'file_type': 'text'},
+        'metadata': {
+            'content_length': len(content),
+            'is_text_file': True
+        }
+    }
+
+def _determine_category(data: dict, content: str) -> str:
+    """Determine workflow category based on content"""
+    content_lower = content.lower()
+
+    # Categories are checked in table order; the first with any keyword wins
+    for category, keywords in _CATEGORY_KEYWORDS:
+        for keyword in keywords:
+            if keyword in content_lower:
+                return category
+
+    return 'General'
+
+def _plan_json_fix(file_path: Path, raw: bytes, data: Optional[Any],
+                   parse_error: Optional[ValueError]) -> Tuple[Optional[bytes], bool, bool, Optional[Any]]:
+    """Repaired file bytes (None if unchanged), which fixes apply, and the fixed data"""
+    data, repaired_content = _fix_json_file(file_path, raw, data, parse_error)
+    fields_added = data is not None and _add_missing_fields(file_path, data)
+    if fields_added:
+        return _dumps(data, indent=True), repaired_content is not None, True, data
+    if repaired_content is not None:
+        return repaired_content.encode('utf-8'), True, False, data
+    return None, False, False, data
+
+def _prepare_workflow(file_path: Path, raw: bytes, data: Optional[Any],
+                      parse_error: Optional[ValueError]) -> Dict[str, Any]:
+    """Analyze one workflow file for import"""
+    try:
+        if parse_error is not None:
+            raise parse_error
+        file_hash = _content_hash(raw)
+        key = (file_hash, data is not None)
+        analysis = _known_analyses.get(key)
+        
+        if data is not None:
+            if analysis is not None:
+                workflow_data = dict(analysis, file_hash=file_hash, raw_data=data)
+            else:
+                workflow_data = _analyze_workflow_json(data, file_path, file_hash)
+                # Without a name of its own the workflow is named after its file,
+                # so the analysis only holds for this path
+                name = data.get('name') if isinstance(data, dict) else None
+                if isinstance(name, str) and name.strip():
+                    analysis = {k: workflow_data[k] for k in ('name', 'content', 'category', 'metadata')}
+        else:
+            if analysis is not None:
+                workflow_data = dict(analysis, name=_text_workflow_name(file_path), file_hash=file_hash,
+                                     raw_data={'content': analysis['content'], 'file_type': 'text'})
+            else:
+                workflow_data = _analyze_workflow_text(raw.decode('utf-8'), file_path, file_hash)
+                analysis = {k: workflow_data[k] for k in ('content', 'category', 'metadata')}
+        
+        if analysis is None:
+            return {'success': True, 'workflow_data': workflow_data}
+        _known_analyses[key] = analysis
+        return {'success': True, 'workflow_data': workflow_data, 'analysis': (key, analysis)}
+        
+    except json.JSONDecodeError as e:
+        return {
+            'success': False,
+            'error_type': 'json_decode_error',
+            'error_message': f"JSON decode error: {str(e)}"
+        }
+    except UnicodeDecodeError as e:
+        return {
+            'success': False,
+            'error_type': 'unicode_decode_error',
+            'error_message': f"Unicode decode error: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error_type': 'import_failed',
+            'error_message': f"Failed to import workflow: {str(e)}"
+        }
+
+def _init_worker(analyses: Optional[Dict[Tuple[str, bool], Dict[str, Any]]] = None):
+    """Process-pool initializer: unbuffered logging, plus the analyses from the last import"""
+    global _known_analyses
+    
+    # A forked worker inherits the parent's log buffer and exits without
+    # running atexit; drop that copy and write straight to the log file
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, MemoryHandler):
+            handler.buffer.clear()
+            root.removeHandler(handler)
+            if handler.target is not None:
+                root.addHandler(handler.target)
+    
+    if analyses is not None:
+        _known_analyses = analyses
+
+def _load_analysis_cache() -> Dict[Tuple[str, bool], Dict[str, Any]]:
+    """Analyses saved by the last import, or an empty dict"""
+    try:
+        with open(_ANALYSIS_CACHE, 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return {}
+    return cached['analyses'] if cached.get('version') == _ANALYSIS_CACHE_VERSION else {}
+
+def _save_analysis_cache(analyses: Dict[Tuple[str, bool], Dict[str, Any]]):
+    _ANALYSIS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    with open(_ANALYSIS_CACHE, 'wb') as f:
+        pickle.dump({'version': _ANALYSIS_CACHE_VERSION, 'analyses': analyses}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _process_file(file_path: Path, validate: bool, fix: bool, prepare: bool) -> Dict[str, Any]:
+    """Process-pool entry point: read one workflow file and run the requested phases on it
+    
+    Validation sees the file as found; the import sees it as fixed.
+    """
+    outcome = {}
+    is_json = file_path.suffix.lower() == '.json'
+    try:
+        raw, data, parse_error = _read_workflow(file_path)
+    except Exception as e:
+        if validate:
+            outcome['validation'] = None, str(e)
+        if fix and is_json:
+            outcome['fix_error'] = str(e)
+        if prepare:
+            outcome['prepared'] = {
+                'success': False,
+                'error_type': 'import_failed',
+                'error_message': f"Failed to import workflow: {str(e)}"
+            }
+        return outcome
+
+    if validate:
+        try:
+            outcome['validation'] = _validate_single_file(file_path, raw, data, parse_error), None
+        except Exception as e:
+            outcome['validation'] = None, str(e)
+
+    if fix and is_json:
+        try:
+            new_content, json_repaired, fields_added, data = _plan_json_fix(file_path, raw, data, parse_error)
+        except Exception as e:
+            outcome['fix_error'] = str(e)
+        else:
+            outcome['fix'] = new_content, json_repaired, fields_added
+            if new_content is not None:
+                raw, parse_error = new_content, None
+
+    if prepare:
+        outcome['prepared'] = _prepare_workflow(file_path, raw, data, parse_error)
+    return outcome
+
+def _safe_hash(file_path: Path, limit: Optional[int] = None) -> Optional[str]:
+    """Thread-pool entry point: file hash, or None if the file cannot be read"""
+    try:
+        return _hash_file(file_path, limit)
+    except OSError as e:
+        logger.warning(f"Could not hash {file_path}: {e}")
+        return None
+
+def _submit_bounded(executor, fn, items, window: int = _POOL_WINDOW):
+    """Submit ``fn`` over ``items`` and yield the futures in order
+    
+    At most ``window`` tasks are queued ahead of the consumer, so results
+    cannot pile up in memory while it catches up.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft()
+
 class ComprehensiveWorkflowManager:
     """Unified workflow management system"""
     
@@ -46,221 +565,395 @@ class ComprehensiveWorkflowManager:
         self.validation_errors = []
         self.fix_results = []
         self.import_errors = []
+        # Import results are updated by both the main thread and the DB writer thread
+        self._import_lock = threading.Lock()
         
     def setup_logging(self):
         """Setup logging configuration"""
+        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        
+        # Log file writes are buffered; warnings and errors flush immediately
+        file_handler = logging.FileHandler('workflow_management.log')
+        file_handler.setLevel(logging.INFO)
+        file_handler.setFormatter(logging.Formatter(log_format))
+        buffered_handler = MemoryHandler(capacity=1024, flushLevel=logging.WARNING, target=file_handler)
+        atexit.register(buffered_handler.flush)
+        
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[
                 logging.StreamHandler(),
-                logging.FileHandler('workflow_management.log')
+                buffered_handler
             ]
         )
         self.logger = logging.getLogger(__name__)
         
     def find_workflow_files(self) -> List[Path]:
         """Find all workflow files"""
-        files = []
-        for pattern in ['**/*.json', '**/*.txt']:
-            files.extend(self.base_path.glob(pattern))
-        return sorted(files)
+        return list(self._scan_workflow_files())
+    
+    def _scan_workflow_files(self) -> Dict[Path, Tuple[int, int]]:
+        """Find all workflow files with their size and mtime_ns, in path order
+        
+        The stat is taken once while listing; later steps use these values
+        instead of asking the filesystem again.
+        """
+        file_stats = {}
+        for entry in _iter_workflow_files(self.base_path):
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            file_stats[Path(entry.path)] = (st.st_size, st.st_mtime_ns)
+        return dict(sorted(file_stats.items()))
     
     def validate_workflows(self) -> Dict[str, Any]:
         """Validate all workflow files"""
-        self.logger.info("Starting workflow validation...")
+        return self.run_all(fix=False, do_import=False)['validation']
+    
+    def fix_workflow_errors(self) -> Dict[str, Any]:
+        """Fix common workflow file errors"""
+        return self.run_all(validate=False, do_import=False)['fixing']
+    
+    def import_workflows(self) -> Dict[str, Any]:
+        """Import workflows with enhanced error handling"""
+        return self.run_all(validate=False, fix=False)['import']
+    
+    def run_all(self, validate: bool = True, fix: bool = True, do_import: bool = True) -> Dict[str, Any]:
+        """Run the requested phases in a single pass over the workflow files
         
-        files = self.find_workflow_files()
-        self.stats['validation']['total'] = len(files)
+        Each file is read and parsed once by a worker process; fixes are
+        applied to the parsed data, written back only when something changed,
+        and the fixed data is what gets imported. Backups, removals, writes
+        and database inserts stay on this thread.
+        """
+        file_stats = self._scan_workflow_files()
+        files = list(file_stats)
+        results = {}
         
-        validation_results = {
-            'timestamp': datetime.now().isoformat(),
-            'summary': {'total_files': len(files), 'valid': 0, 'invalid': 0, 'errors': 0, 'warnings': 0},
-            'errors': [],
-            'warnings': [],
-            'invalid_files': []
-        }
+        if validate:
+            self.logger.info("Starting workflow validation...")
+            self.stats['validation']['total'] = len(files)
+            validation_results = {
+                'timestamp': datetime.now().isoformat(),
+                'summary': {'total_files': len(files), 'valid': 0, 'invalid': 0, 'errors': 0, 'warnings': 0},
+                'errors': [],
+                'warnings': [],
+                'invalid_files': []
+            }
         
-        for file_path in files:
-            try:
-                result = self._validate_single_file(file_path)
-                if result['valid']:
-                    validation_results['summary']['valid'] += 1
-                    self.stats['validation']['valid'] += 1
-                else:
-                    validation_results['summary']['invalid'] += 1
-                    validation_results['invalid_files'].append(str(file_path))
-                    self.stats['validation']['invalid'] += 1
-                    
-                if result['errors']:
-                    validation_results['summary']['errors'] += len(result['errors'])
-                    validation_results['errors'].extend(result['errors'])
-                    
-                if result['warnings']:
-                    validation_results['summary']['warnings'] += len(result['warnings'])
-                    validation_results['warnings'].extend(result['warnings'])
-                    self.stats['validation']['warnings'] += len(result['warnings'])
-                    
-            except Exception as e:
-                self.logger.error(f"Error validating {file_path}: {e}")
-                validation_results['summary']['invalid'] += 1
-                validation_results['errors'].append({
-                    'file': str(file_path),
-                    'error': f"Validation failed: {str(e)}"
-                })
+        if fix:
+            self.logger.info("Starting workflow error fixing...")
+            fix_results = {
+                'timestamp': datetime.now().isoformat(),
+                'summary': {'processed': 0, 'fixed': 0, 'failed': 0},
+                'fixes_applied': defaultdict(int),
+                'fixed_files': [],
+                'failed_files': []
+            }
+            
+            # Create backup directory
+            backup_dir = self.base_path / _BACKUPS_DIR / datetime.now().strftime('%Y%m%d_%H%M%S')
+            backup_dir.mkdir(parents=True, exist_ok=True)
+            
+            duplicates = self._duplicate_copies(self._find_duplicates(file_stats), file_stats)
+            
+            # Fixed files are written back by a thread pool while the pass continues
+            file_writer = ThreadPoolExecutor(max_workers=_FILE_WRITERS)
+            pending_writes = []
+            
+            # Fix tallies stay plain ints until the pass is done
+            duplicates_removed = empty_removed = json_repaired = fields_added = 0
         
-        # Save validation report
-        self._save_validation_report(validation_results)
+        if do_import:
+            # Workers reuse analyses of content seen by the last import; the
+            # ones met in this run are saved for the next
+            analyses = {}
+            pool_options = {'initializer': _init_worker, 'initargs': (_load_analysis_cache(),)}
+        else:
+            pool_options = {'initializer': _init_worker}
         
-        self.logger.info(f"Validation complete: {validation_results['summary']['valid']} valid, "
-                        f"{validation_results['summary']['invalid']} invalid files")
+        # Workers log unbuffered; flush first so the lines logged so far
+        # reach the file before theirs
+        for handler in logging.getLogger().handlers:
+            handler.flush()
         
-        return validation_results
-    
-    def _validate_single_file(self, file_path: Path) -> Dict[str, Any]:
-        """Validate a single workflow file"""
-        result = {'valid': True, 'errors': [], 'warnings': []}
+        # Fork the workers before the database engine and writer thread
+        # exist, so no child inherits a live connection; forked pools start
+        # every worker on the first submit
+        executor = ProcessPoolExecutor(**pool_options)
+        try:
+            executor.submit(int).result()
+            if do_import:
+                self.logger.info("Starting workflow import...")
+                db_manager = self._prepare_import_database()
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
         
-        # Check if file exists and is readable
-        if not file_path.exists():
-            result['valid'] = False
-            result['errors'].append({'file': str(file_path), 'error': 'File does not exist'})
-            return result
-            
-        # Check file size
-        file_size = file_path.stat().st_size
-        if file_size == 0:
-            result['valid'] = False
-            result['errors'].append({'file': str(file_path), 'error': 'Empty file'})
-            return result
-            
-        if file_size > 1024 * 1024:  # 1MB
-            result['warnings'].append({'file': str(file_path), 'warning': f'Large file ({file_size} bytes)'})
+        if do_import:
+            import_results = {
+                'timestamp': datetime.now().isoformat(),
+                'summary': {'total_files': len(files), 'processed': 0, 'errors': 0, 'skipped': 0},
+                'error_breakdown': defaultdict(int),
+                'failed_files': [],
+                'error_details': []
+            }
+            # Rows are inserted by a writer thread, so database round trips
+            # overlap with reading and analyzing the next files
+            rows = queue.Queue(maxsize=_IMPORT_QUEUE_SIZE)
+            session = db_manager.get_sync_session()
+            writer = threading.Thread(
+                target=self._write_workflows,
+                args=(rows, session, import_results, file_stats),
+                name='workflow-db-writer'
+            )
+            writer.start()
         
-        # For JSON files, validate JSON structure
-        if file_path.suffix.lower() == '.json':
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+        try:
+            with executor:
+                task = partial(_process_file, validate=validate, fix=fix, prepare=do_import)
+                outcomes = _submit_bounded(executor, task, files)
+                
+                for i, (file_path, outcome) in enumerate(zip(files, outcomes), 1):
+                    if i % 1000 == 0:
+                        self.logger.info(f"Processing file {i}/{len(files)}: {file_path.name}")
                     
-                # Check for required fields in workflow JSON
-                if isinstance(data, dict):
-                    if not data.get('nodes'):
-                        result['errors'].append({'file': str(file_path), 'error': 'Missing required field: nodes'})
-                        result['valid'] = False
-                        
-                    if not data.get('connections'):
-                        result['errors'].append({'file': str(file_path), 'error': 'Missing required field: connections'})
-                        result['valid'] = False
-                        
-                    # Check for default/empty names
-                    name = data.get('name', '')
-                    if not name or name in ['My workflow', 'New workflow', '']:
-                        result['warnings'].append({'file': str(file_path), 'warning': 'Default or empty workflow name'})
+                    outcome = outcome.result()
+                    file_size = file_stats[file_path][0]
+                    
+                    if validate:
+                        self._record_validation(validation_results, file_path, *outcome['validation'])
+                    
+                    if fix:
+                        removed_duplicate, removed_empty, repaired, added = self._apply_fixes(
+                            fix_results, file_path, file_size, outcome, duplicates, backup_dir,
+                            file_writer, pending_writes
+                        )
+                        duplicates_removed += removed_duplicate
+                        empty_removed += removed_empty
+                        json_repaired += repaired
+                        fields_added += added
                         
-            except json.JSONDecodeError as e:
-                result['valid'] = False
-                result['errors'].append({'file': str(file_path), 'error': f'Invalid JSON: {str(e)}'})
-            except UnicodeDecodeError as e:
-                result['valid'] = False
-                result['errors'].append({'file': str(file_path), 'error': f'Encoding error: {str(e)}'})
-                
-        return result
-    
-    def fix_workflow_errors(self) -> Dict[str, Any]:
-        """Fix common workflow file errors"""
-        self.logger.info("Starting workflow error fixing...")
-        
-        files = self.find_workflow_files()
+                        if removed_duplicate or removed_empty:
+                            # Removed files are not imported
+                            if do_import:
+                                import_results['summary']['total_files'] -= 1
+                            continue
+                    
+                    if do_import:
+                        try:
+                            result = outcome['prepared']
+                            if result['success']:
+                                rows.put(self._workflow_rows(file_path, result['workflow_data']))
+                                if 'analysis' in result:
+                                    key, analysis = result['analysis']
+                                    analyses[key] = analysis
+                            else:
+                                self._record_import_error(import_results, file_path, file_size, result)
+                            
+                        except Exception as e:
+                            self.logger.error(f"Unexpected error importing {file_path}: {e}")
+                            with self._import_lock:
+                                import_results['summary']['errors'] += 1
+                                import_results['error_breakdown']['unexpected_error'] += 1
+                                self.stats['import']['errors'] += 1
+        finally:
+            if fix:
+                file_writer.shutdown()
+            if do_import:
+                # Let the writer flush what is queued, then stop
+                rows.put(None)
+                writer.join()
+                session.close()
         
-        fix_results = {
-            'timestamp': datetime.now().isoformat(),
-            'summary': {'processed': 0, 'fixed': 0, 'failed': 0},
-            'fixes_applied': defaultdict(int),
-            'fixed_files': [],
-            'failed_files': []
-        }
+        if validate:
+            # Save validation report
+            self._save_validation_report(validation_results)
+            
+            self.logger.info(f"Validation complete: {validation_results['summary']['valid']} valid, "
+                            f"{validation_results['summary']['invalid']} invalid files")
+            results['validation'] = validation_results
         
-        # Create backup directory
-        backup_dir = self.base_path / 'backups' / datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_dir.mkdir(parents=True, exist_ok=True)
+        if fix:
+            # Only fixes that were applied appear in the report
+            fix_counts = {
+                'duplicate_files_removed': duplicates_removed,
+                'empty_files_removed': empty_removed,
+                'json_repaired': json_repaired,
+                'missing_fields_added': fields_added
+            }
+            fix_results['fixes_applied'].update((fix, count) for fix, count in fix_counts.items() if count)
+            self._check_fix_writes(fix_results, pending_writes)
+            
+            # Save fix report
+            self._save_fix_report(fix_results)
+            
+            self.logger.info(f"Fixing complete: {fix_results['summary']['fixed']} files fixed, "
+                            f"{fix_results['summary']['failed']} failed")
+            results['fixing'] = fix_results
         
-        duplicates = self._find_duplicates(files)
+        if do_import:
+            try:
+                _save_analysis_cache(analyses)
+            except OSError as e:
+                self.logger.warning(f"Could not save the analysis cache: {e}")
+            self._finish_import(db_manager, import_results)
+            results['import'] = import_results
         
-        for i, file_path in enumerate(files, 1):
-            if i % 100 == 0:
-                self.logger.info(f"Processing file {i}/{len(files)}: {file_path.name}")
+        return results
+    
+    def _record_validation(self, validation_results: Dict[str, Any], file_path: Path,
+                           result: Optional[Dict[str, Any]], error: Optional[str]):
+        """Tally one file's validation result"""
+        if error is None:
+            if result['valid']:
+                validation_results['summary']['valid'] += 1
+                self.stats['validation']['valid'] += 1
+            else:
+                validation_results['summary']['invalid'] += 1
+                validation_results['invalid_files'].append(str(file_path))
+                self.stats['validation']['invalid'] += 1
                 
-            try:
-                fix_results['summary']['processed'] += 1
-                self.stats['fixing']['processed'] += 1
+            if result['errors']:
+                validation_results['summary']['errors'] += len(result['errors'])
+                validation_results['errors'].extend(result['errors'])
                 
-                fixed = False
+            if result['warnings']:
+                validation_results['summary']['warnings'] += len(result['warnings'])
+                validation_results['warnings'].extend(result['warnings'])
+                self.stats['validation']['warnings'] += len(result['warnings'])
                 
-                # Handle duplicates
-                if str(file_path) in duplicates and len(duplicates[str(file_path)]) > 1:
-                    # Keep the first occurrence, remove others
-                    if file_path != duplicates[str(file_path)][0]:
-                        self._backup_file(file_path, backup_dir)
-                        file_path.unlink()
-                        fix_results['fixes_applied']['duplicate_files_removed'] += 1
-                        fixed = True
-                        continue
+        else:
+            self.logger.error(f"Error validating {file_path}: {error}")
+            validation_results['summary']['invalid'] += 1
+            validation_results['errors'].append({
+                'file': str(file_path),
+                'error': f"Validation failed: {error}"
+            })
+    
+    def _apply_fixes(self, fix_results: Dict[str, Any], file_path: Path, file_size: int, outcome: Dict[str, Any],
+                     duplicates: Dict[Path, Path], backup_dir: Path, file_writer: ThreadPoolExecutor,
+                     pending_writes: List[Tuple[Path, Future]]) -> Tuple[bool, bool, bool, bool]:
+        """Remove or rewrite one file as its fix plan says
+        
+        Returns which fixes were applied: duplicate removed, empty file
+        removed, JSON repaired, missing fields added. The caller tallies them.
+        Rewrites are handed to ``file_writer``; their futures are collected in
+        ``pending_writes`` for _check_fix_writes.
+        """
+        duplicate_removed = empty_removed = json_repaired = fields_added = False
+        try:
+            fix_results['summary']['processed'] += 1
+            self.stats['fixing']['processed'] += 1
+            
+            fixed = False
+            
+            # Handle duplicates; only the copies to remove are listed
+            kept = duplicates.get(file_path)
+            if kept is not None:
+                self.logger.info(f"Removing duplicate of {kept}: {file_path}")
+                self._backup_file(file_path, backup_dir)
+                file_path.unlink()
+                duplicate_removed = True
+                return duplicate_removed, empty_removed, json_repaired, fields_added
+            
+            # Check if file is empty
+            if file_size == 0:
+                self.logger.warning(f"Removing empty file: {file_path}")
+                self._backup_file(file_path, backup_dir)
+                file_path.unlink()
+                empty_removed = True
+                return duplicate_removed, empty_removed, json_repaired, fields_added
+            
+            # Fix JSON files, then back up and write at most once
+            if 'fix_error' in outcome:
+                raise OSError(outcome['fix_error'])
+            if 'fix' in outcome:
+                new_content, json_repaired, fields_added = outcome['fix']
+                fixed = json_repaired or fields_added
                 
-                # Check if file is empty
-                if file_path.stat().st_size == 0:
-                    self.logger.warning(f"Removing empty file: {file_path}")
+                if fixed:
+                    # Backups stay on this thread, since backup names must not collide
                     self._backup_file(file_path, backup_dir)
-                    file_path.unlink()
-                    fix_results['fixes_applied']['empty_files_removed'] += 1
-                    fixed = True
-                    continue
-                
-                # Fix JSON files
-                if file_path.suffix.lower() == '.json':
-                    json_fixed = self._fix_json_file(file_path, backup_dir)
-                    if json_fixed:
-                        fix_results['fixes_applied']['json_repaired'] += 1
-                        fixed = True
-                        
-                    # Add missing fields
-                    fields_added = self._add_missing_fields(file_path, backup_dir)
-                    if fields_added:
-                        fix_results['fixes_applied']['missing_fields_added'] += 1
-                        fixed = True
+                    pending_writes.append((file_path, file_writer.submit(file_path.write_bytes, new_content)))
+            
+            if fixed:
+                fix_results['summary']['fixed'] += 1
+                fix_results['fixed_files'].append(str(file_path))
+                self.stats['fixing']['fixed'] += 1
                 
-                if fixed:
-                    fix_results['summary']['fixed'] += 1
-                    fix_results['fixed_files'].append(str(file_path))
-                    self.stats['fixing']['fixed'] += 1
-                    
-            except Exception as e:
-                self.logger.error(f"Error fixing {file_path}: {e}")
-                fix_results['summary']['failed'] += 1
-                fix_results['failed_files'].append({'file': str(file_path), 'error': str(e)})
-                self.stats['fixing']['failed'] += 1
-        
-        # Save fix report
-        self._save_fix_report(fix_results)
-        
-        self.logger.info(f"Fixing complete: {fix_results['summary']['fixed']} files fixed, "
-                        f"{fix_results['summary']['failed']} failed")
+        except Exception as e:
+            self.logger.error(f"Error fixing {file_path}: {e}")
+            fix_results['summary']['failed'] += 1
+            fix_results['failed_files'].append({'file': str(file_path), 'error': str(e)})
+            self.stats['fixing']['failed'] += 1
         
-        return fix_results
+        return duplicate_removed, empty_removed, json_repaired, fields_added
+    
+    def _check_fix_writes(self, fix_results: Dict[str, Any], pending_writes: List[Tuple[Path, Future]]):
+        """Move files whose fixed content could not be written from fixed to failed"""
+        for file_path, write in pending_writes:
+            error = write.exception()
+            if error is None:
+                continue
+            self.logger.error(f"Error fixing {file_path}: {error}")
+            fix_results['summary']['fixed'] -= 1
+            fix_results['fixed_files'].remove(str(file_path))
+            self.stats['fixing']['fixed'] -= 1
+            fix_results['summary']['failed'] += 1
+            fix_results['failed_files'].append({'file': str(file_path), 'error': str(error)})
+            self.stats['fixing']['failed'] += 1
     
-    def _find_duplicates(self, files: List[Path]) -> Dict[str, List[Path]]:
-        """Find duplicate files based on content hash"""
-        hash_to_files = defaultdict(list)
+    def _find_duplicates(self, file_stats: Dict[Path, Tuple[int, int]]) -> Dict[str, List[Path]]:
+        """Find duplicate files based on content hash
         
-        for file_path in files:
-            try:
-                with open(file_path, 'rb') as f:
-                    file_hash = hashlib.md5(f.read()).hexdigest()
+        Files are grouped by size, then by a hash of their first bytes; only
+        files that still collide are hashed in full.
+        """
+        size_groups = defaultdict(list)
+        for file_path, (file_size, _) in file_stats.items():
+            size_groups[file_size].append(file_path)
+        
+        # Hashing is I/O-bound and releases the GIL, so threads are enough
+        with ThreadPoolExecutor() as executor:
+            candidates = [(size, p) for size, paths in size_groups.items() if len(paths) > 1 for p in paths]
+            prefix_hashes = executor.map(_safe_hash, [p for _, p in candidates], repeat(_PREFIX_BYTES))
+            prefix_groups = defaultdict(list)
+            for (size, file_path), prefix_hash in zip(candidates, prefix_hashes):
+                if prefix_hash is not None:
+                    prefix_groups[(size, prefix_hash)].append(file_path)
+            
+            colliding = [p for paths in prefix_groups.values() if len(paths) > 1 for p in paths]
+            hash_to_files = defaultdict(list)
+            for file_path, file_hash in zip(colliding, executor.map(_safe_hash, colliding)):
+                if file_hash is not None:
                     hash_to_files[file_hash].append(file_path)
-            except Exception as e:
-                self.logger.warning(f"Could not hash {file_path}: {e}")
         
-        return {h: paths for h, paths in hash_to_files.items() if len(paths) > 1}
+        duplicates = defaultdict(list)
+        for file_hash, paths in hash_to_files.items():
+            if len(paths) > 1:
+                duplicates[file_hash] = paths
+        return duplicates
+    
+    def _duplicate_copies(self, duplicates: Dict[str, List[Path]],
+                          file_stats: Dict[Path, Tuple[int, int]]) -> Dict[Path, Path]:
+        """Map each duplicate file to remove to the copy that is kept
+        
+        The kept copy is the oldest file of its group by modification time,
+        then by path. Files under the backups directory are neither kept nor
+        removed.
+        """
+        backups = self.base_path / _BACKUPS_DIR
+        copies = {}
+        for paths in duplicates.values():
+            live = [path for path in paths if backups not in path.parents]
+            if len(live) < 2:
+                continue
+            kept, *removed = sorted(live, key=lambda path: (file_stats[path][1], path))
+            copies.update(dict.fromkeys(removed, kept))
+        return copies
     
     def _backup_file(self, file_path: Path, backup_dir: Path):
         """Create backup of file before modification"""
@@ -271,82 +964,10 @@ class ComprehensiveWorkflowManager:
             counter += 1
         shutil.copy2(file_path, backup_path)
     
-    def _fix_json_file(self, file_path: Path, backup_dir: Path) -> bool:
-        """Fix common JSON syntax errors"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Try to parse as-is first
-            try:
-                json.loads(content)
-                return False  # Already valid
-            except json.JSONDecodeError:
-                pass
-            
-            # Common fixes
-            original_content = content
-            
-            # Remove trailing commas
-            content = re.sub(r',\s*}', '}', content)
-            content = re.sub(r',\s*]', ']', content)
-            
-            # Fix unescaped quotes in strings
-            content = re.sub(r'"([^"]*?)"([^"]*?)"([^"]*?)"', r'"\1\"\2\"\3"', content)
-            
-            # Try to parse fixed content
-            try:
-                json.loads(content)
-                # Backup original and save fixed version
-                self._backup_file(file_path, backup_dir)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                self.logger.info(f"Repaired JSON syntax in: {file_path}")
-                return True
-            except json.JSONDecodeError:
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Error fixing JSON in {file_path}: {e}")
-            return False
-    
-    def _add_missing_fields(self, file_path: Path, backup_dir: Path) -> bool:
-        """Add missing required fields to workflow JSON"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if not isinstance(data, dict):
-                return False
-                
-            modified = False
-            
-            # Add missing nodes field
-            if 'nodes' not in data:
-                data['nodes'] = []
-                modified = True
-                
-            # Add missing connections field
-            if 'connections' not in data:
-                data['connections'] = {}
-                modified = True
-            
-            if modified:
-                self._backup_file(file_path, backup_dir)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
-                self.logger.info(f"Added missing fields to: {file_path}")
-                return True
-                
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"Error adding fields to {file_path}: {e}")
-            return False
-    
-    def import_workflows(self) -> Dict[str, Any]:
-        """Import workflows with enhanced error handling"""
-        self.logger.info("Starting workflow import...")
+    def _prepare_import_database(self) -> "DatabaseManager":
+        """Set up the sync engine and clear existing workflow data"""
+        from sqlalchemy import text
+        from src.n8n_scraper.database.connection import DatabaseManager
         
         try:
             db_manager = DatabaseManager()
@@ -363,6 +984,9 @@ class ComprehensiveWorkflowManager:
                     pool_timeout=settings.db_pool_timeout,
                     pool_recycle=3600,
                     echo=settings.is_development,
+                    # workflow_data carries the whole parsed workflow; encode it with orjson
+                    json_serializer=_json_column,
+                    json_deserializer=_loads,
                 )
                 
                 db_manager._sync_session_factory = sessionmaker(
@@ -370,54 +994,27 @@ class ComprehensiveWorkflowManager:
                     expire_on_commit=False,
                 )
             
-            # Clear existing workflows
+            # Clear existing workflows; their chunks go with them through ON DELETE CASCADE
             self.logger.info("Clearing existing workflow data...")
             session = db_manager.get_sync_session()
             try:
-                session.execute(text("DELETE FROM unified_chunks WHERE document_id IN (SELECT id FROM unified_documents WHERE document_type = 'workflow')"))
                 session.execute(text("DELETE FROM unified_documents WHERE document_type = 'workflow'"))
                 session.commit()
             finally:
                 session.close()
             
-            files = self.find_workflow_files()
-            
-            import_results = {
-                'timestamp': datetime.now().isoformat(),
-                'summary': {'total_files': len(files), 'processed': 0, 'errors': 0, 'skipped': 0},
-                'error_breakdown': defaultdict(int),
-                'failed_files': [],
-                'error_details': []
-            }
-            
-            for i, file_path in enumerate(files, 1):
-                if i % 100 == 0:
-                    self.logger.info(f"Importing file {i}/{len(files)}: {file_path.name}")
-                
-                try:
-                    result = self._import_single_workflow(file_path, db_manager)
-                    if result['success']:
-                        import_results['summary']['processed'] += 1
-                        self.stats['import']['processed'] += 1
-                    else:
-                        import_results['summary']['errors'] += 1
-                        import_results['error_breakdown'][result['error_type']] += 1
-                        import_results['failed_files'].append(str(file_path))
-                        import_results['error_details'].append({
-                            'file_path': str(file_path),
-                            'error_type': result['error_type'],
-                            'error_message': result['error_message'],
-                            'workflow_name': result.get('workflow_name', 'Unknown'),
-                            'file_size': file_path.stat().st_size
-                        })
-                        self.stats['import']['errors'] += 1
-                        
-                except Exception as e:
-                    self.logger.error(f"Unexpected error importing {file_path}: {e}")
-                    import_results['summary']['errors'] += 1
-                    import_results['error_breakdown']['unexpected_error'] += 1
-                    self.stats['import']['errors'] += 1
+            return db_manager
             
+        except Exception as e:
+            self.logger.error(f"Import failed: {e}")
+            raise
+    
+    def _finish_import(self, db_manager: "DatabaseManager", import_results: Dict[str, Any]):
+        """Record final database statistics and save the import report"""
+        from sqlalchemy import text
+        from src.n8n_scraper.database.unified_models import UnifiedDocument, UnifiedChunk
+        
+        try:
             # Get final database statistics
             session = db_manager.get_sync_session()
             try:
@@ -443,223 +1040,161 @@ class ComprehensiveWorkflowManager:
             self.logger.info(f"Import complete: {import_results['summary']['processed']} imported, "
                            f"{import_results['summary']['errors']} errors")
             
-            return import_results
-            
         except Exception as e:
             self.logger.error(f"Import failed: {e}")
             raise
     
-    def _import_single_workflow(self, file_path: Path, db_manager: DatabaseManager) -> Dict[str, Any]:
-        """Import a single workflow file"""
-        try:
-            # Read and analyze file
-            if file_path.suffix.lower() == '.json':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                workflow_data = self._analyze_workflow_json(data, file_path)
-            else:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                workflow_data = self._analyze_workflow_text(content, file_path)
-            
-            # Create workflow record
-            session = db_manager.get_sync_session()
-            try:
-                workflow = UnifiedDocument(
-                    title=workflow_data['name'],
-                    content=workflow_data['content'],
-                    category=workflow_data['category'],
-                    file_path=str(file_path),
-                    file_name=file_path.name,
-                    content_hash=workflow_data['file_hash'],
-                    cache_metadata=workflow_data.get('metadata', {}),
-                    document_type='workflow',
-                    source_type='file_import',
-                    workflow_id=workflow_data['name'],
-                    workflow_data=workflow_data.get('raw_data', {}),
-                    node_count=workflow_data.get('metadata', {}).get('node_count', 0),
-                    word_count=len(workflow_data['content'].split()),
-                    content_length=len(workflow_data['content'])
-                )
-                
-                session.add(workflow)
-                session.flush()  # Get the ID
-                
-                # Create chunks
-                chunks = self._create_workflow_chunks(workflow_data['content'], workflow.id)
-                for chunk in chunks:
-                    session.add(chunk)
-                
-                session.commit()
-            finally:
-                session.close()
-                
-            return {
-                'success': True,
-                'workflow_name': workflow_data['name']
-            }
-            
-        except json.JSONDecodeError as e:
-            return {
-                'success': False,
-                'error_type': 'json_decode_error',
-                'error_message': f"JSON decode error: {str(e)}"
-            }
-        except UnicodeDecodeError as e:
-            return {
-                'success': False,
-                'error_type': 'unicode_decode_error',
-                'error_message': f"Unicode decode error: {str(e)}"
-            }
-        except Exception as e:
-            return {
-                'success': False,
-                'error_type': 'import_failed',
-                'error_message': f"Failed to import workflow: {str(e)}"
-            }
-    
-    def _analyze_workflow_json(self, data: dict, file_path: Path) -> Dict[str, Any]:
-        """Analyze JSON workflow data"""
-        # Extract content parts
-        content_parts = []
-        
-        # Add workflow name - ensure it's not empty and not too long
-        name = data.get('name', file_path.stem)
-        if not name or name.strip() == '':
-            name = file_path.stem
-        if not name or name.strip() == '':
-            name = 'Unnamed Workflow'
-        
-        # Truncate name if too long (max 120 chars to leave room for safety)
-        if len(name) > 120:
-            name = name[:120]
-        
-        content_parts.append(f"Workflow: {name}")
-        
-        # Add description if available
-        if data.get('meta', {}).get('description'):
-            content_parts.append(f"Description: {data['meta']['description']}")
-        
-        # Add node information
-        nodes = data.get('nodes', [])
-        if nodes:
-            content_parts.append(f"Nodes ({len(nodes)}):")
-            for node in nodes:
-                node_type = node.get('type', 'Unknown')
-                node_name = node.get('name', node.get('id', 'Unnamed'))
-                content_parts.append(f"- {node_name} ({node_type})")
-        
-        # Add tags
-        tags = data.get('tags', [])
-        if tags:
-            tag_names = []
-            for tag in tags:
-                if isinstance(tag, dict):
-                    tag_names.append(tag.get('name', str(tag)))
-                else:
-                    tag_names.append(str(tag))
-            content_parts.append(f"Tags: {', '.join(tag_names)}")
-        
-        # Ensure all parts are strings
-        content_parts = [str(part) for part in content_parts]
-        content = '\n'.join(content_parts)
-        
-        # Calculate file hash
-        with open(file_path, 'rb') as f:
-            file_hash = hashlib.md5(f.read()).hexdigest()
+    def _workflow_rows(self, file_path: Path, workflow_data: Dict[str, Any]) -> Tuple[Path, Dict[str, Any], List[Dict[str, Any]]]:
+        """Build the document row and chunk rows for one analyzed workflow
         
-        return {
-            'name': name,
+        Bulk inserts skip the model validators, so the title and content
+        checks are applied here.
+        """
+        title = workflow_data['name'].strip()
+        content = workflow_data['content']
+        if not title:
+            raise ValueError("Title cannot be empty")
+        if not content.strip():
+            raise ValueError("Content cannot be empty")
+        
+        # Generate the id here so chunk rows can reference it without a round trip
+        document_id = uuid4()
+        document = {
+            'id': document_id,
+            'title': title,
             'content': content,
-            'category': self._determine_category(data, content),
-            'file_hash': file_hash,
-            'raw_data': data,
-            'metadata': {
-                'node_count': len(nodes),
-                'has_description': bool(data.get('meta', {}).get('description')),
-                'tags': [str(tag) if not isinstance(tag, dict) else tag.get('name', str(tag)) for tag in tags]
-            }
+            'category': workflow_data['category'],
+            'file_path': str(file_path),
+            'file_name': file_path.name,
+            'content_hash': workflow_data['file_hash'],
+            'cache_metadata': workflow_data.get('metadata', {}),
+            'document_type': 'workflow',
+            'source_type': 'file_import',
+            'workflow_id': workflow_data['name'],
+            'workflow_data': workflow_data.get('raw_data', {}),
+            'node_count': workflow_data.get('metadata', {}).get('node_count', 0),
+            'word_count': len(content.split()),
+            'content_length': len(content)
         }
+        return file_path, document, self._create_workflow_chunks(content, document_id)
     
-    def _analyze_workflow_text(self, content: str, file_path: Path) -> Dict[str, Any]:
-        """Analyze text workflow content"""
-        # Calculate file hash
-        file_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
-        
-        # Handle name - ensure it's not empty and not too long
-        name = file_path.stem
-        if not name or name.strip() == '':
-            name = 'Unnamed Workflow'
+    def _write_workflows(self, rows: queue.Queue, session, import_results: Dict[str, Any],
+                         file_stats: Dict[Path, Tuple[int, int]]):
+        """DB writer thread: insert queued workflow rows in batches until the None sentinel"""
+        done = False
+        while not done:
+            item = rows.get()
+            if item is None:
+                break
+            batch = [item]
+            
+            # Fill the batch until it is full or the flush interval runs out
+            deadline = time.monotonic() + _IMPORT_FLUSH_SECONDS
+            while len(batch) < _IMPORT_BATCH_SIZE:
+                try:
+                    item = rows.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+            
+            self._insert_workflow_batch(session, batch, import_results, file_stats)
+    
+    def _insert_workflow_batch(self, session, batch: List[Tuple[Path, Dict[str, Any], List[Dict[str, Any]]]],
+                               import_results: Dict[str, Any], file_stats: Dict[Path, Tuple[int, int]]):
+        """Insert a batch of workflows and their chunks in one transaction
         
-        # Truncate name if too long (max 120 chars to leave room for safety)
-        if len(name) > 120:
-            name = name[:120]
+        If the batch fails, its workflows are retried one at a time so a
+        single bad row only fails its own file.
+        """
+        try:
+            self._insert_workflows(session, batch)
+            imported = len(batch)
+        except Exception as e:
+            session.rollback()
+            self.logger.warning(f"Batch of {len(batch)} workflows failed ({e}); retrying one at a time")
+            imported = 0
+            for item in batch:
+                file_path, document, _ = item
+                try:
+                    self._insert_workflows(session, [item])
+                    imported += 1
+                except Exception as e:
+                    session.rollback()
+                    self.logger.error(f"Failed to import {file_path}: {e}")
+                    self._record_import_error(import_results, file_path, file_stats[file_path][0], {
+                        'error_type': 'import_failed',
+                        'error_message': f"Failed to import workflow: {str(e)}",
+                        'workflow_name': document['workflow_id']
+                    })
         
-        return {
-            'name': name,
-            'content': content,
-            'category': self._determine_category({}, content),
-            'file_hash': file_hash,
-            'raw_data': {'content': content, 'file_type': 'text'},
-            'metadata': {
-                'content_length': len(content),
-                'is_text_file': True
-            }
-        }
+        with self._import_lock:
+            import_results['summary']['processed'] += imported
+            self.stats['import']['processed'] += imported
     
-    def _determine_category(self, data: dict, content: str) -> str:
-        """Determine workflow category based on content"""
-        content_lower = content.lower()
-        
-        # Category mapping based on keywords
-        categories = {
-            'email': ['email', 'gmail', 'outlook', 'smtp', 'imap'],
-            'communication': ['slack', 'discord', 'telegram', 'whatsapp', 'teams'],
-            'crm': ['hubspot', 'salesforce', 'pipedrive', 'zoho'],
-            'ecommerce': ['shopify', 'woocommerce', 'stripe', 'paypal'],
-            'cloud': ['aws', 'azure', 'gcp', 'google cloud'],
-            'data': ['database', 'mysql', 'postgres', 'mongodb', 'airtable'],
-            'monitoring': ['prometheus', 'grafana', 'datadog', 'newrelic'],
-            'api': ['rest', 'graphql', 'webhook', 'http request'],
-            'automation': ['cron', 'schedule', 'trigger', 'automation'],
-            'social': ['twitter', 'facebook', 'linkedin', 'instagram'],
-            'productivity': ['notion', 'trello', 'asana', 'jira']
-        }
+    def _insert_workflows(self, session, batch: List[Tuple[Path, Dict[str, Any], List[Dict[str, Any]]]]):
+        """Insert workflows and their chunks, then commit"""
+        from sqlalchemy import insert
+        from src.n8n_scraper.database.unified_models import UnifiedDocument, UnifiedChunk
         
-        for category, keywords in categories.items():
-            if any(keyword in content_lower for keyword in keywords):
-                return category.title()
-        
-        return 'General'
+        session.execute(insert(UnifiedDocument), [document for _, document, _ in batch])
+        chunk_rows = [chunk for _, _, chunks in batch for chunk in chunks]
+        if chunk_rows:
+            session.execute(insert(UnifiedChunk), chunk_rows)
+        session.commit()
+    
+    def _record_import_error(self, import_results: Dict[str, Any], file_path: Path, file_size: int,
+                             result: Dict[str, Any]):
+        """Record a workflow that failed to import"""
+        with self._import_lock:
+            import_results['summary']['errors'] += 1
+            import_results['error_breakdown'][result['error_type']] += 1
+            import_results['failed_files'].append(str(file_path))
+            import_results['error_details'].append({
+                'file_path': str(file_path),
+                'error_type': result['error_type'],
+                'error_message': result['error_message'],
+                'workflow_name': result.get('workflow_name', 'Unknown'),
+                'file_size': file_size
+            })
+            self.stats['import']['errors'] += 1
     
-    def _create_workflow_chunks(self, content: str, workflow_id: int) -> List[UnifiedChunk]:
-        """Create searchable chunks from workflow content"""
+    def _create_workflow_chunks(self, content: str, workflow_id: UUID) -> List[Dict[str, Any]]:
+        """Create searchable chunk rows from workflow content"""
         chunks = []
         
         # Split content into chunks (max 500 chars per chunk)
         chunk_size = 500
         overlap = 50
         
+        # Chunk hashes are stored for identity only and never looked up, so
+        # an 8-byte digest is enough. ASCII content is encoded once and hashed
+        # through memoryview slices; otherwise byte offsets differ from
+        # character offsets and each chunk is encoded on its own.
+        data = memoryview(content.encode('ascii')) if content.isascii() else None
+        
         for i in range(0, len(content), chunk_size - overlap):
             chunk_content = content[i:i + chunk_size]
             if chunk_content.strip():
-                chunk_hash = hashlib.md5(chunk_content.encode('utf-8')).hexdigest()
-                chunk = UnifiedChunk(
-                    document_id=workflow_id,
-                    content=chunk_content,
-                    chunk_index=len(chunks),
-                    chunk_type='workflow',
-                    content_hash=chunk_hash
-                )
-                chunks.append(chunk)
+                chunk_bytes = data[i:i + chunk_size] if data is not None else chunk_content.encode('utf-8')
+                chunk_hash = hashlib.blake2b(chunk_bytes, digest_size=8).hexdigest()
+                chunks.append({
+                    'document_id': workflow_id,
+                    'content': chunk_content,
+                    'chunk_index': len(chunks),
+                    'chunk_type': 'workflow',
+                    'content_hash': chunk_hash
+                })
         
         return chunks
     
     def _save_validation_report(self, results: Dict[str, Any]):
         """Save validation report to files"""
         # JSON report
-        with open('validation_report.json', 'w') as f:
-            json.dump(results, f, indent=2)
+        with open('validation_report.json', 'wb') as f:
+            f.write(_dumps(results, indent=True))
         
         # Text report
         with open('validation_report.txt', 'w') as f:
@@ -681,8 +1216,8 @@ class ComprehensiveWorkflowManager:
     def _save_fix_report(self, results: Dict[str, Any]):
         """Save fix report to files"""
         # JSON report
-        with open('recovery_report.json', 'w') as f:
-            json.dump(results, f, indent=2)
+        with open('recovery_report.json', 'wb') as f:
+            f.write(_dumps(results, indent=True))
         
         # Text report
         with open('recovery_report.txt', 'w') as f:
@@ -699,8 +1234,8 @@ class ComprehensiveWorkflowManager:
     def _save_import_report(self, results: Dict[str, Any]):
         """Save import report to files"""
         # JSON report
-        with open('import_error_report.json', 'w') as f:
-            json.dump(results, f, indent=2)
+        with open('import_error_report.json', 'wb') as f:
+            f.write(_dumps(results, indent=True))
         
         # Text report
         with open('import_error_report.txt', 'w') as f:
@@ -740,17 +1275,9 @@ class ComprehensiveWorkflowManager:
         }
         
         try:
-            # Step 1: Validate workflows
-            self.logger.info("=== Step 1: Validation ===")
-            results['validation'] = self.validate_workflows()
-            
-            # Step 2: Fix errors
-            self.logger.info("=== Step 2: Error Fixing ===")
-            results['fixing'] = self.fix_workflow_errors()
-            
-            # Step 3: Import workflows
-            self.logger.info("=== Step 3: Import ===")
-            results['import'] = self.import_workflows()
+            # Validate, fix and import in one pass over the files
+            self.logger.info("=== Validation, Error Fixing and Import ===")
+            results.update(self.run_all())
             
             # Final summary
             self.logger.info("=== Complete Process Summary ===")
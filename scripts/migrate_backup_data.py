@@ -19,6 +19,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rows sent per executemany call
+INSERT_BATCH_SIZE = 500
+
+WORKFLOW_INSERT = """
+    INSERT INTO unified_documents (
+        id, document_type, source_type, file_path, title, content, 
+        content_hash, word_count, content_length, 
+        category, tags, node_count, integrations,
+        quality_score, complexity_score, is_processed,
+        metadata, created_at, updated_at
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6, $7, $8, $9, 
+        $10, $11, $12, $13, $14, $15, $16, $17, $18, $19
+    )
+"""
+
+DOCUMENT_INSERT = """
+    INSERT INTO unified_documents (
+        id, document_type, source_type, url, title, content, 
+        content_hash, word_count, content_length, category,
+        headings_count, links_count, code_blocks_count, images_count,
+        metadata, created_at, updated_at
+    ) VALUES (
+        $1, 'documentation', 'web_scrape', $2, $3, $4, $5, $6, $7, $8,
+        $9, $10, $11, $12, $13, $14, $15
+    )
+"""
+
 
 class BackupDataMigrator:
     """Migrates data from backup tables to unified schema."""
@@ -46,6 +74,37 @@ class BackupDataMigrator:
         """Generate MD5 hash for content."""
         return hashlib.md5(content.encode('utf-8')).hexdigest()
     
+    async def insert_rows(self, conn, query: str, rows: list) -> int:
+        """Insert (description, args) rows in one executemany batch.
+        
+        If the batch fails, rows are retried one at a time so a bad row is
+        logged and skipped without losing the rest. Returns the number of
+        rows inserted.
+        """
+        if not rows:
+            return 0
+        
+        try:
+            async with conn.transaction():
+                await conn.executemany(query, [args for _, args in rows])
+            return len(rows)
+        except Exception as e:
+            logger.warning(f"Batch insert of {len(rows)} rows failed, retrying row by row: {e}")
+        
+        inserted = 0
+        for description, args in rows:
+            try:
+                await conn.execute(query, *args)
+                inserted += 1
+            except Exception as e:
+                logger.error(f"Failed to migrate {description}: {e}")
+        return inserted
+    
+    async def fetch_existing_hashes(self, conn) -> set:
+        """Content hashes already in unified_documents, for in-memory duplicate checks."""
+        records = await conn.fetch("SELECT content_hash FROM unified_documents")
+        return {record['content_hash'] for record in records}
+    
     async def migrate_workflow_documents(self) -> int:
         """Migrate workflow documents from backup table."""
         logger.info("Migrating workflow documents...")
@@ -58,6 +117,10 @@ class BackupDataMigrator:
                 workflows = await conn.fetch("SELECT * FROM workflow_documents_backup LIMIT 500")
                 logger.info(f"Found {len(workflows)} workflow documents to migrate")
                 
+                # Rows are inserted in batches; queued hashes join the existing set
+                existing_hashes = await self.fetch_existing_hashes(conn)
+                rows = []
+                
                 for workflow in workflows:
                     try:
                         # Generate UUID for new record
@@ -80,12 +143,7 @@ class BackupDataMigrator:
                         content_hash = self.generate_content_hash(content)
                         
                         # Check if document already exists
-                        existing = await conn.fetchval(
-                            "SELECT id FROM unified_documents WHERE content_hash = $1",
-                            content_hash
-                        )
-                        
-                        if existing:
+                        if content_hash in existing_hashes:
                             logger.debug(f"Document with hash {content_hash} already exists, skipping")
                             continue
                         
@@ -126,19 +184,8 @@ class BackupDataMigrator:
                             else:
                                 quality_score = raw_quality
                         
-                        # Insert into unified_documents table using correct column names
-                        await conn.execute("""
-                            INSERT INTO unified_documents (
-                                id, document_type, source_type, file_path, title, content, 
-                                content_hash, word_count, content_length, 
-                                category, tags, node_count, integrations,
-                                quality_score, complexity_score, is_processed,
-                                metadata, created_at, updated_at
-                            ) VALUES (
-                                $1, $2, $3, $4, $5, $6, $7, $8, $9, 
-                                $10, $11, $12, $13, $14, $15, $16, $17, $18, $19
-                            )
-                        """, 
+                        # Queue for unified_documents using correct column names
+                        rows.append((f"workflow document {workflow.get('id')}", (
                             new_id,
                             'workflow',
                             'file_import',
@@ -158,16 +205,19 @@ class BackupDataMigrator:
                             json.dumps(metadata),
                             workflow['created_at'] or datetime.utcnow(),
                             workflow['updated_at'] or datetime.utcnow()
-                        )
-                        
-                        migrated_count += 1
+                        )))
+                        existing_hashes.add(content_hash)
                         
-                        if migrated_count % 10 == 0:
+                        if len(rows) >= INSERT_BATCH_SIZE:
+                            migrated_count += await self.insert_rows(conn, WORKFLOW_INSERT, rows)
+                            rows = []
                             logger.info(f"Migrated {migrated_count} workflow documents...")
                             
                     except Exception as e:
                         logger.error(f"Failed to migrate workflow document {workflow.get('id')}: {e}")
                         continue
+                
+                migrated_count += await self.insert_rows(conn, WORKFLOW_INSERT, rows)
                         
             except Exception as e:
                 logger.error(f"Failed to fetch workflow documents: {e}")
@@ -194,6 +244,9 @@ class BackupDataMigrator:
             
             logger.info(f"Found {len(backup_tables)} backup tables to migrate")
             
+            # One lookup up front instead of a query per document
+            existing_hashes = await self.fetch_existing_hashes(conn)
+            
             for table_row in backup_tables:
                 table_name = table_row['table_name']
                 # Extract category from table name
@@ -205,6 +258,9 @@ class BackupDataMigrator:
                     # Get documents from this table
                     documents = await conn.fetch(f"SELECT * FROM {table_name} LIMIT 50")
                     
+                    # Each table's rows go in one batch; queued hashes join the existing set
+                    rows = []
+                    
                     for doc in documents:
                         try:
                             # Generate UUID for new record
@@ -215,12 +271,7 @@ class BackupDataMigrator:
                             content_hash = self.generate_content_hash(content)
                             
                             # Check if document already exists
-                            existing = await conn.fetchval(
-                                "SELECT id FROM unified_documents WHERE content_hash = $1",
-                                content_hash
-                            )
-                            
-                            if existing:
+                            if content_hash in existing_hashes:
                                 logger.debug(f"Document with hash {content_hash} already exists, skipping")
                                 continue
                             
@@ -232,18 +283,8 @@ class BackupDataMigrator:
                                 except json.JSONDecodeError:
                                     metadata = {}
                             
-                            # Insert into unified_documents table using correct column names
-                            await conn.execute("""
-                                INSERT INTO unified_documents (
-                                    id, document_type, source_type, url, title, content, 
-                                    content_hash, word_count, content_length, category,
-                                    headings_count, links_count, code_blocks_count, images_count,
-                                    metadata, created_at, updated_at
-                                ) VALUES (
-                                    $1, 'documentation', 'web_scrape', $2, $3, $4, $5, $6, $7, $8,
-                                    $9, $10, $11, $12, $13, $14, $15
-                                )
-                            """, 
+                            # Queue for unified_documents using correct column names
+                            rows.append((f"document {doc.get('id')} from {table_name}", (
                                 new_id,
                                 doc['url'],
                                 title,
@@ -259,17 +300,16 @@ class BackupDataMigrator:
                                 json.dumps(metadata),
                                 doc['created_at'] or datetime.utcnow(),
                                 datetime.utcnow()
-                            )
-                            
-                            migrated_count += 1
-                            
-                            if migrated_count % 10 == 0:
-                                logger.info(f"Migrated {migrated_count} documents so far...")
+                            )))
+                            existing_hashes.add(content_hash)
                             
                         except Exception as e:
                             logger.error(f"Failed to migrate document {doc.get('id')} from {table_name}: {e}")
                             continue
                     
+                    migrated_count += await self.insert_rows(conn, DOCUMENT_INSERT, rows)
+                    logger.info(f"Migrated {migrated_count} documents so far...")
+                    
                     logger.info(f"Processed {len(documents)} documents from {table_name}")
                     
                 except Exception as e:
@@ -182,7 +182,7 @@ class RedisHealthCheck(HealthCheck):
                 host=settings.redis_host,
                 port=settings.redis_port,
                 db=settings.redis_db,
-                password=settings.redis_password,
+                password=settings.redis_password.get_secret_value() if settings.redis_password else None,
                 socket_timeout=self.timeout,
             )
             
@@ -249,7 +249,7 @@ class AIProviderHealthCheck(HealthCheck):
         try:
             import openai
             
-            client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
+            client = openai.AsyncOpenAI(api_key=settings.openai_api_key.get_secret_value())
             
             # Test with a minimal request
             response = await client.chat.completions.create(
@@ -287,7 +287,7 @@ class AIProviderHealthCheck(HealthCheck):
         try:
             import anthropic
             
-            client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+            client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key.get_secret_value())
             
             # Test with a minimal request
             response = await client.messages.create(
@@ -78,7 +78,7 @@ class LoggingConfig:
         
         # Use settings defaults if not provided
         log_level = log_level or settings.log_level
-        log_file = log_file or settings.log_file
+        log_file = log_file or settings.log_file_path
         enable_json = enable_json if enable_json is not None else settings.enable_json_logging
         
         # Configure root logger
@@ -26,7 +26,7 @@ from sqlalchemy import (
     CheckConstraint,
     Enum,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID, JSONB, REAL
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
@@ -368,7 +368,7 @@ class UnifiedChunk(Base, TimestampMixin):
     integrations = Column(JSONB, nullable=True, default=list)
     
     # Vector Embeddings
-    embedding = Column(JSONB, nullable=True)
+    embedding = Column(ARRAY(REAL), nullable=True)
     embedding_model = Column(String(128), nullable=True)
     
     # Relationships
@@ -30,7 +30,7 @@ class VectorStore:
     
     def __init__(self, model_name: Optional[str] = None):
         self.model_name = model_name or settings.embedding_model
-        self.vector_db_path = settings.vector_db_path
+        self.vector_db_path = Path(settings.vector_db_path)
         self.dimension = settings.embedding_dimension
         self._model: Optional[SentenceTransformer] = None
         self._index = None
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test suite for the comprehensive workflow manager script
+"""
+
+import json
+import os
+from pathlib import Path
+from collections import defaultdict
+
+import pytest
+
+from scripts import comprehensive_workflow_manager as cwm
+
+
+WORKFLOW = {
+    "name": "Duplicate workflow",
+    "nodes": [{"name": "Start", "type": "n8n-nodes-base.start", "parameters": {}}],
+    "connections": {},
+}
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Manager over an empty workflow directory, logging inside tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    workflows = tmp_path / "workflows"
+    workflows.mkdir()
+    return cwm.ComprehensiveWorkflowManager(str(workflows))
+
+
+def write_workflow(path, workflow):
+    """Write a workflow file and return its path"""
+    path.write_text(json.dumps(workflow))
+    return path
+
+
+class TestDuplicateRemoval:
+    """Test detection and removal of duplicate workflow files"""
+
+    def test_find_duplicates_groups_by_content(self, manager):
+        """Test that only files with identical content are grouped"""
+        first = write_workflow(manager.base_path / "a.json", WORKFLOW)
+        second = write_workflow(manager.base_path / "b.json", WORKFLOW)
+        write_workflow(manager.base_path / "c.json", dict(WORKFLOW, name="Other workflow"))
+
+        duplicates = manager._find_duplicates(manager._scan_workflow_files())
+        assert isinstance(duplicates, defaultdict)
+        assert list(duplicates.values()) == [[first, second]]
+
+    def test_oldest_copy_is_kept(self, manager):
+        """Test that each duplicate maps to the oldest file with its content"""
+        newer = write_workflow(manager.base_path / "a.json", WORKFLOW)
+        oldest = write_workflow(manager.base_path / "b.json", WORKFLOW)
+        newest = write_workflow(manager.base_path / "c.json", WORKFLOW)
+        for age, path in enumerate([newest, newer, oldest]):
+            os.utime(path, ns=(0, 10**18 - age * 10**9))
+
+        file_stats = manager._scan_workflow_files()
+        copies = manager._duplicate_copies(manager._find_duplicates(file_stats), file_stats)
+        assert copies == {newer: oldest, newest: oldest}
+
+    def test_backups_are_never_scanned(self, manager):
+        """Test that a backup from an earlier run never replaces the live workflow"""
+        (manager.base_path / "backups" / "20260101_000000").mkdir(parents=True)
+        (manager.base_path / "zapier").mkdir()
+        backup = write_workflow(manager.base_path / "backups" / "20260101_000000" / "a.json", WORKFLOW)
+        live = write_workflow(manager.base_path / "zapier" / "a.json", WORKFLOW)
+        os.utime(backup, ns=(0, 10**18 - 10**9))
+        os.utime(live, ns=(0, 10**18))
+
+        assert backup not in manager._scan_workflow_files()
+        results = manager.run_all(validate=False, fix=True, do_import=False)
+
+        assert live.exists()
+        assert backup.exists()
+        assert "duplicate_files_removed" not in results["fixing"]["fixes_applied"]
+
+    def test_fix_removes_duplicates(self, manager):
+        """Test that fixing removes the later copies and keeps the first"""
+        first = write_workflow(manager.base_path / "a.json", WORKFLOW)
+        second = write_workflow(manager.base_path / "b.json", WORKFLOW)
+        other = write_workflow(manager.base_path / "c.json", dict(WORKFLOW, name="Other workflow"))
+
+        results = manager.run_all(validate=False, fix=True, do_import=False)
+
+        assert first.exists()
+        assert other.exists()
+        assert not second.exists()
+        assert results["fixing"]["fixes_applied"]["duplicate_files_removed"] == 1
+        backups = list((manager.base_path / "backups").rglob("b.json"))
+        assert len(backups) == 1
+
+
+class TestValidation:
+    """Test validation of workflow files"""
+
+    def test_validate_reports_invalid_files(self, manager):
+        """Test that broken JSON and missing fields are reported"""
+        write_workflow(manager.base_path / "good.json", dict(WORKFLOW, connections={"Start": {"main": [[]]}}))
+        (manager.base_path / "broken.json").write_text('{"name": "Broken",')
+        write_workflow(manager.base_path / "bare.json", {"name": "Bare"})
+
+        results = manager.validate_workflows()
+
+        assert results["summary"]["valid"] == 1
+        assert results["summary"]["invalid"] == 2
+        assert sorted(Path(path).name for path in results["invalid_files"]) == ["bare.json", "broken.json"]
+
+
+class TestFixing:
+    """Test repair of workflow files"""
+
+    def test_fix_repairs_trailing_commas(self, manager):
+        """Test that trailing commas are removed and the file rewritten"""
+        path = manager.base_path / "commas.json"
+        path.write_text('{"name": "Commas", "nodes": [{"name": "Start"},], "connections": {},}')
+
+        results = manager.fix_workflow_errors()
+
+        assert json.loads(path.read_text())["nodes"] == [{"name": "Start"}]
+        assert results["fixes_applied"]["json_repaired"] == 1
+
+    def test_fix_adds_missing_fields(self, manager):
+        """Test that nodes and connections are added to bare workflows"""
+        path = write_workflow(manager.base_path / "bare.json", {"name": "Bare"})
+
+        results = manager.fix_workflow_errors()
+
+        data = json.loads(path.read_text())
+        assert data["nodes"] == [] and data["connections"] == {}
+        assert results["fixes_applied"]["missing_fields_added"] == 1
+        assert list((manager.base_path / "backups").rglob("bare.json"))
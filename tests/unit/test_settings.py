@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Test suite for application settings
+"""
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from config import settings as settings_module
+from config.settings import Settings, get_settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings():
+    """Drop the cached settings instance around each test"""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+class TestLazySettings:
+    """Test lazy construction of the global settings"""
+
+    def test_get_settings_is_cached(self):
+        """Test that repeated calls return the same instance"""
+        first = get_settings()
+        assert isinstance(first, Settings)
+        assert get_settings() is first
+
+    def test_module_settings_attribute(self):
+        """Test that ``settings`` resolves through the cached accessor"""
+        assert settings_module.settings is get_settings()
+
+    def test_compat_exports(self):
+        """Test that legacy module constants resolve on access"""
+        current = get_settings()
+        assert settings_module.DATA_DIR == current.data_dir
+        assert settings_module.API_PORT == current.api_port
+        assert settings_module.DEFAULT_AI_PROVIDER == current.default_ai_provider
+
+    def test_unknown_attribute(self):
+        """Test that unknown module attributes still raise"""
+        with pytest.raises(AttributeError):
+            settings_module.NOT_A_SETTING
+
+
+class TestSettingsSections:
+    """Test composition of the configuration sections"""
+
+    def test_flat_attributes(self):
+        """Test that flat attribute names resolve on their section"""
+        current = get_settings()
+        assert current.api_port == current.api.api_port
+        assert current.database_url == current.db.database_url
+        assert current.data_dir == current.paths.data_dir
+        assert isinstance(Settings.__dict__["api_port"], property)
+
+    def test_flat_keyword_arguments(self):
+        """Test that flat keyword arguments are applied to their section"""
+        current = Settings(api_port=1, database_url="postgresql://db/test", debug=True)
+        assert current.api_port == 1
+        assert current.api.api_port == 1
+        assert current.database_url == "postgresql://db/test"
+        assert current.debug is True
+
+    def test_flat_keyword_argument_conflicts(self):
+        """Test that flat keyword arguments that cannot be applied raise"""
+        from config.settings import APIConfig
+
+        with pytest.raises(TypeError):
+            Settings(api_port=1, api=APIConfig())
+        with pytest.raises(TypeError):
+            Settings(enable_metrics=False)
+
+    def test_derived_paths(self):
+        """Test that derived paths are filled in on the sections"""
+        current = get_settings()
+        assert current.db.vector_db_path == str(current.paths.data_dir / "vector_db")
+        assert current.log.log_file == str(current.paths.logs_dir / "system.log")
+        assert current.log_file_path == current.paths.logs_dir / "system.log"
+
+    def test_deferred_section(self, monkeypatch):
+        """Test that rarely read settings load on first access"""
+        current = get_settings()
+        assert "deferred" not in current.__dict__
+
+        monkeypatch.setenv("JAEGER_ENDPOINT", "http://jaeger:14268")
+        assert current.jaeger_endpoint == "http://jaeger:14268"
+        assert current.deferred.jaeger_endpoint == current.jaeger_endpoint
+        assert current.enable_metrics is True
+
+    def test_unknown_field(self):
+        """Test that unknown attributes still raise"""
+        with pytest.raises(AttributeError):
+            get_settings().not_a_setting
+
+    def test_settings_are_frozen(self):
+        """Test that settings reject assignment after loading"""
+        from pydantic import ValidationError
+
+        current = get_settings()
+        with pytest.raises(ValidationError):
+            current.debug = True
+        with pytest.raises(ValidationError):
+            current.api.api_port = 1
+
+    def test_default_sections_skip_validation(self, monkeypatch):
+        """Test that untouched sections are constructed and overridden ones validated"""
+        monkeypatch.setenv("API_PORT", "9002")
+        current = get_settings()
+        assert current.api.api_port == 9002
+        assert current.api.model_fields_set
+        assert not current.scraping.model_fields_set
+        assert current.scraping == type(current.scraping)()
+
+    @pytest.mark.parametrize("env", [{}, {"LOG_LEVEL": "DEBUG", "UPDATE_FREQUENCY": "weekly"}])
+    def test_enum_fields_hold_values(self, env, monkeypatch):
+        """Test that enum fields are plain strings whether or not a section is overridden"""
+        for name in ("LOG_LEVEL", "UPDATE_FREQUENCY"):
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        current = get_settings()
+        assert type(current.log_level) is str
+        assert type(current.update_frequency) is str
+        assert f"{current.log_level}" == env.get("LOG_LEVEL", "INFO")
+        assert type(current.to_dict()["log"]["log_level"]) is str
+
+    def test_validate(self):
+        """Test that validate checks sections built without validation"""
+        from pydantic import ValidationError
+        from config.settings import APIConfig
+
+        current = get_settings()
+        assert current.validate() == current
+
+        broken = current.model_copy(update={"api": APIConfig.model_construct(api_port="not a port")})
+        with pytest.raises(ValidationError):
+            broken.validate()
+
+    def test_validate_in_development(self, monkeypatch):
+        """Test that ENVIRONMENT=development validates the settings on load"""
+        calls = []
+        monkeypatch.setattr(Settings, "validate", lambda self: calls.append(self))
+        get_settings()
+        assert not calls
+
+        get_settings.cache_clear()
+        monkeypatch.setenv("ENVIRONMENT", "development")
+        assert calls == [get_settings()]
+
+    def test_secrets_are_masked(self, monkeypatch):
+        """Test that API keys are hidden from repr but exposed to legacy constants"""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        current = get_settings()
+        assert "sk-test" not in repr(current)
+        assert current.openai_api_key.get_secret_value() == "sk-test"
+        assert current.secret_key.get_secret_value()
+        assert settings_module.OPENAI_API_KEY == "sk-test"
+
+    def test_to_dict_is_cached(self):
+        """Test that the dictionary form is built once and includes sections"""
+        current = get_settings()
+        data = current.to_dict()
+        assert data["api"]["api_port"] == current.api_port
+        assert current.to_dict() is data
+
+
+class TestSettingsParsing:
+    """Test parsing of the configuration sections"""
+
+    def test_csv_env_lists(self, monkeypatch):
+        """Test that comma-separated env values are split and stripped"""
+        from config.settings import APIConfig
+
+        monkeypatch.setenv("CORS_ALLOW_METHODS", " GET , POST")
+        monkeypatch.setenv("CORS_ALLOW_HEADERS", '["X-Token"]')
+        api = APIConfig()
+        assert api.cors_allow_methods == ["GET", "POST"]
+        assert api.cors_allow_headers == ["X-Token"]
+
+    @pytest.mark.parametrize("raw,expected", [("true", True), (" Off ", False), ("1", True), ("no", False)])
+    def test_env_booleans(self, raw, expected, monkeypatch):
+        """Test that boolean env spellings are interpreted"""
+        from config.settings import APIConfig
+
+        monkeypatch.setenv("API_DEBUG", raw)
+        assert APIConfig().api_debug is expected
+
+    def test_invalid_env_boolean(self, monkeypatch):
+        """Test that unknown boolean spellings are still rejected"""
+        from pydantic import ValidationError
+        from config.settings import APIConfig
+
+        monkeypatch.setenv("API_DEBUG", "maybe")
+        with pytest.raises(ValidationError):
+            APIConfig()
+
+    def test_legacy_cors_origins(self, monkeypatch):
+        """Test that CORS_ORIGINS feeds cors_allow_origins unless it is set"""
+        from config.settings import APIConfig
+
+        monkeypatch.setenv("CORS_ORIGINS", "https://a.example, https://b.example")
+        api = APIConfig()
+        assert api.cors_allow_origins == ["https://a.example", "https://b.example"]
+        assert api.cors_origins is api.cors_allow_origins
+
+        monkeypatch.setenv("CORS_ALLOW_ORIGINS", "https://c.example")
+        assert APIConfig().cors_origins == ["https://c.example"]
+
+    def test_dotenv_values(self, monkeypatch):
+        """Test that cached .env values apply below real env vars"""
+        from config.settings import APIConfig
+
+        monkeypatch.setitem(settings_module._dotenv_values(), "api_port", "9001")
+        monkeypatch.setitem(settings_module._dotenv_values(), "api_host", "10.0.0.1")
+        monkeypatch.setenv("API_HOST", "127.0.0.1")
+        api = APIConfig()
+        assert api.api_port == 9001
+        assert api.api_host == "127.0.0.1"
+
+    @pytest.mark.parametrize("name", ["DB", "LOG", "API", "PATHS"])
+    def test_section_names_not_read_from_env(self, name, monkeypatch):
+        """Test that env vars named after a section do not replace it"""
+        monkeypatch.setenv(name, "x")
+        monkeypatch.setitem(settings_module._dotenv_values(), name.lower(), "x")
+        current = get_settings()
+        assert current.api_port == current.api.api_port
+
+    def test_default_dirs(self):
+        """Test that directories default to the project layout"""
+        from config.settings import PathConfig
+
+        paths = PathConfig()
+        assert paths.data_dir == paths.base_dir / "data"
+        assert paths.logs_dir == paths.base_dir / "data" / "logs"
+        assert paths.backups_dir == paths.base_dir / "backups"
+
+
+class TestSettingsDirectories:
+    """Test creation of the data directories"""
+
+    def test_directories_created_once(self, tmp_path, monkeypatch):
+        """Test that directories are created by the first settings instance only"""
+        monkeypatch.setattr(settings_module, "_ENSURED", set())
+        monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+        get_settings()
+        assert (tmp_path / "data" / "scraped_docs").is_dir()
+
+        (tmp_path / "data" / "scraped_docs").rmdir()
+        get_settings.cache_clear()
+        get_settings()
+        assert not (tmp_path / "data" / "scraped_docs").exists()
+
+    def test_directories_skipped_when_testing(self, tmp_path, monkeypatch):
+        """Test that the testing environment never creates directories"""
+        monkeypatch.setattr(settings_module, "_ENSURED", set())
+        monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+        monkeypatch.setenv("ENVIRONMENT", "testing")
+        assert get_settings().data_dir == tmp_path / "data"
+        assert not (tmp_path / "data").exists()
+
+
+class TestSettingsEnvironment:
+    """Test the environment checks"""
+
+    @pytest.mark.parametrize("environment", ["development", "testing", "production"])
+    def test_environment_flags(self, environment, monkeypatch):
+        """Test that exactly the matching environment flag is set"""
+        monkeypatch.setenv("ENVIRONMENT", environment)
+        current = get_settings()
+        assert current.is_development == (environment == "development")
+        assert current.is_testing == (environment == "testing")
+        assert current.is_production == (environment == "production")
+
+    def test_log_level_int(self, monkeypatch):
+        """Test that the numeric log level matches the configured name"""
+        import logging
+
+        monkeypatch.setenv("LOG_LEVEL", "ERROR")
+        current = get_settings()
+        assert current.log_level_int == logging.ERROR
+        assert current.get_log_level() == logging.ERROR
+
+    def test_log_level_enum_int_value(self):
+        """Test that log level members carry their numeric level"""
+        import logging
+        from config.settings import LogLevel
+
+        assert LogLevel.DEBUG.int_value == logging.DEBUG
+        assert LogLevel.CRITICAL.int_value == logging.CRITICAL